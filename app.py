@@ -2,7 +2,7 @@ import streamlit as st
 import yaml
 import os
 import pandas as pd
-import plotly.express as px
+import numpy as np
 import plotly.graph_objects as go
 from pathlib import Path
 import time
@@ -10,6 +10,7 @@ import time
 # Import authentication and data management
 from auth import init_auth, login_page, logout_button, require_auth
 from models import TradingDataManager
+from utils import _m4_downsample
 
 # Page configuration
 st.set_page_config(
@@ -72,6 +73,11 @@ st.markdown("""
 # Initialize authentication and data manager
 init_auth()
 
+@st.cache_resource
+def get_data_manager():
+    """Shared TradingDataManager for all sessions in this process."""
+    return TradingDataManager()
+
 def main():
     # Check if user is authenticated
     if not st.session_state.session_id:
@@ -89,25 +95,8 @@ def main():
     st.sidebar.markdown("---")
     
     # Navigation menu based on user role
-    if is_admin:
-        # Admin navigation
-        pages = {
-            "🏠 Dashboard Overview": "admin_dashboard",
-            "📊 Upload Trade Log": "admin_upload_trades",
-            "👥 Manage Clients": "admin_manage_clients",
-            "💰 Capital Movements": "admin_capital_movements",
-            "🏦 Capital Accounts": "admin_capital_accounts",
-            "⚙️ Configuration": "admin_configuration",
-            "📈 Strategy Analysis": "admin_strategy_analysis",
-            "📋 Strategy Details": "admin_strategy_details"
-        }
-    else:
-        # Client navigation
-        pages = {
-            "🏠 Capital Account": "client_capital_account",
-            "📊 Strategy Summary": "client_strategy_summary",
-            "📋 Strategy Details": "client_strategy_details"
-        }
+    # Navigation tables are module-level constants (built once at import)
+    pages = _ADMIN_PAGES if is_admin else _CLIENT_PAGES
     
     selected_page = st.sidebar.selectbox(
         "Select Page",
@@ -117,48 +106,29 @@ def main():
     # Load the selected page
     page_function = pages[selected_page]
     
-    # Initialize data manager
-    if 'data_manager' not in st.session_state:
-        st.session_state.data_manager = TradingDataManager()
+    # Initialize data manager (shared across sessions via st.cache_resource)
+    st.session_state.data_manager = get_data_manager()
+    if 'last_data_refresh' not in st.session_state:
         st.session_state.last_data_refresh = 0
-    
+
     # Always refresh data to ensure we have the latest from files
     # This ensures all sessions see the same data
     current_time = time.time()
-    
-    # Refresh data every 30 seconds or on first load
+
+    # Refresh data every 30 seconds or on first load; the manager itself
+    # throttles so only one session per window hits the disk
     if current_time - st.session_state.last_data_refresh > 30:
         try:
-            st.session_state.data_manager.refresh_data()
+            st.session_state.data_manager.refresh_data(min_interval=30)
             st.session_state.last_data_refresh = current_time
         except Exception as e:
             # If refresh fails, recreate the data manager
-            st.session_state.data_manager = TradingDataManager()
+            get_data_manager.clear()
+            st.session_state.data_manager = get_data_manager()
             st.session_state.last_data_refresh = current_time
     
     # Display selected page
-    if page_function == "admin_dashboard":
-        admin_dashboard_page()
-    elif page_function == "admin_upload_trades":
-        admin_upload_trades_page()
-    elif page_function == "admin_manage_clients":
-        admin_manage_clients_page()
-    elif page_function == "admin_capital_movements":
-        admin_capital_movements_page()
-    elif page_function == "admin_capital_accounts":
-        admin_capital_accounts_page()
-    elif page_function == "admin_configuration":
-        admin_configuration_page()
-    elif page_function == "admin_strategy_analysis":
-        admin_strategy_analysis_page()
-    elif page_function == "admin_strategy_details":
-        admin_strategy_details_page()
-    elif page_function == "client_capital_account":
-        client_capital_account_page()
-    elif page_function == "client_strategy_summary":
-        client_strategy_summary_page()
-    elif page_function == "client_strategy_details":
-        client_strategy_details_page()
+    page_function()
     
     # Footer
     st.sidebar.markdown("---")
@@ -168,7 +138,356 @@ def main():
     # Logout button
     logout_button()
 
+# Month options for the monthly-capital form, built once at import
+MONTH_OPTIONS = tuple(f"{y}-{m:02d}" for y in range(2024, 2028) for m in range(1, 13))
+
+# Display column subsets, defined once so table renders always ship a
+# narrow pre-selected frame to the browser
+_RECENT_COLS = ('trade_id', 'stock', 'buy_date', 'sell_date', 'profit_loss', 'win_loss')
+_SEP_COLS = ('sell_date', 'stock', 'buy_price', 'sell_price', 'quantity', 'profit_loss')
+_HIGH_RETURN_COLS = ('stock', 'buy_price', 'sell_price', 'profit_loss', 'return_pct', 'sell_date')
+
+# Monthly capital-progression table: shown columns plus client-side number
+# formats, so rendering never materializes a column-subset copy
+_MONTHLY_COLS = ('month', 'starting_capital', 'capital_after_contributions', 'monthly_return_pct',
+                 'profit_after_tax', 'investor_share', 'trader_share', 'ending_capital')
+_MONTHLY_COL_CONFIG = {
+    'starting_capital': st.column_config.NumberColumn(format="$%.2f"),
+    'capital_after_contributions': st.column_config.NumberColumn(format="$%.2f"),
+    'monthly_return_pct': st.column_config.NumberColumn(format="%.2f%%"),
+    'profit_after_tax': st.column_config.NumberColumn(format="$%.2f"),
+    'investor_share': st.column_config.NumberColumn(format="$%.2f"),
+    'trader_share': st.column_config.NumberColumn(format="$%.2f"),
+    'ending_capital': st.column_config.NumberColumn(format="$%.2f"),
+}
+
+def _data_token():
+    """Cache key for the memoized computations below: the manager's save
+    counter (bumped on every data mutation) combined with the session's
+    refresh timestamp, so uploads and edits invalidate immediately and
+    the Refresh Data buttons still force a recompute."""
+    return (st.session_state.data_manager.data_version,
+            st.session_state.last_data_refresh)
+
+# Memoized data-manager computations. _data_token() is passed as the
+# cache key so data mutations and refreshes naturally invalidate these.
+@st.cache_data(ttl=24*60*60, show_spinner=False)
+def _cached_capital_flow(client_id, refresh_token):
+    return st.session_state.data_manager.get_client_capital_flow(client_id)
+
+@st.cache_data(ttl=24*60*60, show_spinner=False)
+def _cached_strategy_summary(refresh_token):
+    return st.session_state.data_manager.get_strategy_summary()
+
+@st.cache_data(ttl=24*60*60, show_spinner=False)
+def _cached_monthly_returns(refresh_token):
+    return st.session_state.data_manager.get_monthly_strategy_returns()
+
+# The S&P 500 fetch hits the network, so it gets a shorter TTL and is
+# shared across all sessions until it expires
+@st.cache_data(ttl=3600, show_spinner="Fetching S&P 500 data...")
+def _sp500_monthly():
+    return st.session_state.data_manager.get_sp500_monthly_returns()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cum_profit_fig(client_id, client_name, refresh_token):
+    """Plotly spec for the biweekly cumulative-profit chart. Cached as a
+    plain dict so repeat reruns skip figure construction and most of the
+    serialization work."""
+    biweekly_df = _cached_capital_flow(client_id, refresh_token)['biweekly_breakdown_df']
+    x, y = _m4_downsample(biweekly_df['period_label'].to_numpy(),
+                          biweekly_df['cumulative_profit'].to_numpy())
+    fig = go.Figure(
+        data=[go.Scattergl(
+            x=x,
+            y=y,
+            mode='lines+markers',
+            name='Cumulative Profit',
+            line=dict(color='green', width=3),
+            marker=dict(size=6)
+        )],
+        layout=go.Layout(
+            title=f"Cumulative Profit (Biweekly) - {client_name}",
+            xaxis_title="Biweekly Period",
+            yaxis_title="Cumulative Profit ($)",
+            hovermode='x unified'
+        )
+    )
+    return fig.to_dict()
+
+def _trades_content_key():
+    """Content fingerprint of the trades frame. Unlike _data_token(),
+    this is stable across restarts and sessions (data_version resets to 0
+    per process and last_data_refresh is per-session wall-clock time), so
+    it is the right key for disk-persisted caches."""
+    trades_df = st.session_state.data_manager.trades_df
+    if trades_df.empty:
+        return 0
+    persisted = [c for c in trades_df.columns if not c.startswith('_sell')]
+    return int(pd.util.hash_pandas_object(trades_df[persisted], index=False).sum())
+
+@st.cache_data(persist="disk", ttl=24*60*60, show_spinner=False)
+def _monthly_returns_with_sp500(trades_key):
+    """Monthly strategy returns joined with the S&P 500 benchmark columns.
+    Disk-persisted so the joined table survives app restarts."""
+    monthly_returns = st.session_state.data_manager.get_monthly_strategy_returns()
+    sp500_returns = _sp500_monthly()
+    # A dict-lookup join on the single Month key is much cheaper than
+    # pd.merge for a table this small; missing months map to 0 via fillna
+    sp500_ret_by_month = dict(zip(sp500_returns['Month'], sp500_returns['SP500_Return_Pct']))
+    sp500_cum_by_month = dict(zip(sp500_returns['Month'], sp500_returns['SP500_Cumulative_Return']))
+    joined = monthly_returns.copy()
+    joined['SP500_Return_Pct'] = joined['Month'].map(sp500_ret_by_month).fillna(0)
+    joined['SP500_Cumulative_Return'] = joined['Month'].map(sp500_cum_by_month).fillna(0)
+    return joined
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _strategy_details_data(refresh_token):
+    """Filtered trades plus per-month per-stock returns for the strategy
+    details pages, memoized so widget reruns skip the groupby."""
+    trades_df = st.session_state.data_manager.trades_df
+    filtered_trades = trades_df[trades_df['quantity'] >= 2].copy()
+    if filtered_trades.empty:
+        return filtered_trades, filtered_trades, filtered_trades, []
+    filtered_trades['month'] = filtered_trades['sell_date'].dt.to_period('M')
+    # observed=True keeps only traded (month, stock) pairs — without it a
+    # categorical stock column expands to the full Cartesian product —
+    # and sort=False skips a sort we redo by return_pct anyway
+    monthly_stock_returns = filtered_trades.groupby(['month', 'stock'], observed=True, sort=False).agg({
+        'buy_price': 'first',
+        'sell_price': 'last',
+        'quantity': 'sum',
+        'profit_loss': 'sum'
+    }).reset_index()
+    monthly_stock_returns['return_pct'] = ((monthly_stock_returns['sell_price'] - monthly_stock_returns['buy_price']) / monthly_stock_returns['buy_price'] * 100).round(2)
+    # One sort each way plus groupby().head(5) replaces per-month
+    # nlargest/nsmallest calls in the render loop
+    winners = monthly_stock_returns.sort_values(['month', 'return_pct'], ascending=[True, False]) \
+        .groupby('month', sort=False).head(5)[['month', 'stock', 'return_pct']]
+    losers = monthly_stock_returns.sort_values(['month', 'return_pct']) \
+        .groupby('month', sort=False).head(5)[['month', 'stock', 'return_pct']]
+    # Periods aren't Arrow-serializable; the display tables take strings
+    winners['month'] = winners['month'].astype(str)
+    losers['month'] = losers['month'].astype(str)
+    months = sorted(monthly_stock_returns['month'].unique())
+    return filtered_trades, winners, losers, months
+
+@st.fragment
+def _debug_block(client_capital, data_manager, user_info):
+    """Debug details behind a checkbox; a fragment so toggling it reruns
+    only this block instead of the whole capital account page."""
+    if st.checkbox("🔍 Show Debug Info", help="Display technical details about the data"):
+        st.write("**Debug Information:**")
+        st.write(f"- Client ID: {user_info['username']}")
+        st.write(f"- Investment start date: {data_manager.get_client_info(user_info['username'])['investment_start_date']}")
+        st.write(f"- Monthly breakdown length: {len(client_capital.get('monthly_breakdown', []))}")
+        st.write(f"- Biweekly breakdown length: {len(client_capital.get('biweekly_breakdown', []))}")
+        if client_capital.get('monthly_breakdown'):
+            st.write("**Monthly breakdown months:**")
+            for month in client_capital['monthly_breakdown']:
+                st.write(f"  - {month['month']}")
+
+def _safe_refresh():
+    """Reload data, falling back to a fresh manager if the reload fails.
+
+    Single code path for every Refresh button, so the cold recovery branch
+    isn't duplicated across pages."""
+    try:
+        st.session_state.data_manager.refresh_data()
+    except Exception:
+        # If refresh fails, recreate the data manager
+        get_data_manager.clear()
+        st.session_state.data_manager = get_data_manager()
+    st.session_state.last_data_refresh = time.time()
+    st.success("Data refreshed successfully!")
+    st.rerun()
+
+@st.fragment
+def _refresh_button():
+    """Shared Refresh Data button; a fragment so a click reloads data without
+    rerunning the rest of the page's widgets first."""
+    col1, col2, col3 = st.columns([1, 1, 4])
+    with col1:
+        if st.button("🔄 Refresh Data", help="Reload all data from files"):
+            _safe_refresh()
+
+def _capital_overview_table(client_capital, config):
+    """Render the capital overview as one table; eight st.metric calls mean
+    eight separate frontend messages per rerun."""
+    starting = client_capital['starting_capital']
+    investor_returns = client_capital['total_returns'] * config['investor_share']
+    investor_return_pct = (investor_returns / starting * 100) if starting > 0 else 0
+    overview = pd.DataFrame({
+        'Metric': ['Starting Capital', 'Current Capital', 'Total Contributions',
+                   'Total Withdrawals', 'Investor Returns', 'Investor Return %',
+                   'Tax Rate', 'Investor Share'],
+        'Value': [f"${starting:,.2f}",
+                  f"${client_capital['current_capital']:,.2f}",
+                  f"${client_capital['total_contributions']:,.2f}",
+                  f"${client_capital['total_withdrawals']:,.2f}",
+                  f"${investor_returns:,.2f}",
+                  f"{investor_return_pct:.2f}%",
+                  f"{config['tax_rate']*100:.1f}%",
+                  f"{config['investor_share']*100:.1f}%"]
+    })
+    st.dataframe(overview, hide_index=True, use_container_width=True)
+
 # Admin Pages
+@st.cache_data
+def _recent_rows(_df, cols, sig):
+    """Last five rows of a frame, cached so the same slice is not re-encoded
+    to Arrow on every rerun. sig (row count + last index label) is the key."""
+    return _df.tail(5)[list(cols)].reset_index(drop=True)
+
+@st.fragment
+def _diagnostics_panel(data_manager):
+    """Diagnostic panels; a fragment so their buttons rerun only this
+    subtree instead of the whole page."""
+    trades = data_manager.trades_df
+    n_trades = len(trades)
+    has_trades = n_trades > 0
+
+    # Diagnostics do full-frame scans and render several dataframes, so keep
+    # them collapsed and skip the work entirely unless explicitly enabled
+    show_diagnostics = st.checkbox("Enable diagnostics", key="show_diag")
+
+    # Add trade removal diagnostic section
+    if show_diagnostics and has_trades:
+        with st.expander("🔍 Trade Analysis & Removal Tools", expanded=False):
+            # return_pct is maintained as a persistent column by the data
+            # manager, so this is a pure mask with no copy or recompute
+            high_returns = trades.loc[trades['return_pct'] > 1000]
+            if not high_returns.empty:
+                st.write("**🚨 High Return Percentage Trades (>1000%):**")
+                st.dataframe(high_returns[list(_HIGH_RETURN_COLS)], use_container_width=True)
+            
+                # Manual removal options
+                st.write("**Manual Trade Removal:**")
+                col1, col2 = st.columns(2)
+            
+                with col1:
+                    if st.button("Remove All High Return Trades (>1000%)"):
+                        # Build the mask directly on the live frame instead of
+                        # matching against the diagnostic copy's index
+                        live_df = data_manager.trades_df
+                        return_pct = live_df['return_pct']
+                        original_count = len(live_df)
+                        data_manager.trades_df = live_df.loc[~(return_pct > 1000)]
+                        removed_count = original_count - len(data_manager.trades_df)
+                        data_manager._queue_save()
+                        st.success(f"Removed {removed_count} high return trades!")
+                        st.rerun()
+            
+                with col2:
+                    if st.button("Remove MSTR & COIN High Returns"):
+                        # One combined mask on the live frame instead of two
+                        # per-stock filters and two index scans
+                        live_df = data_manager.trades_df
+                        return_pct = live_df['return_pct']
+                        mask = live_df['stock'].isin({'MSTR', 'COIN'}) & (return_pct > 1000)
+                        original_count = len(live_df)
+                        data_manager.trades_df = live_df.loc[~mask]
+                        removed_count = original_count - len(data_manager.trades_df)
+                        data_manager._queue_save()
+                        st.success(f"Removed {removed_count} MSTR & COIN high return trades!")
+                        st.rerun()
+    
+    # Add September calculation diagnostic
+    if show_diagnostics and has_trades:
+        with st.expander("🔍 September Return Calculation Diagnostic", expanded=False):
+            # Show all available data first
+            st.write("**📊 Data Analysis:**")
+
+            # Compute the sell-date series and its month periods once and reuse
+            sd = trades['sell_date']
+            months = sd.dt.to_period('M')
+
+            # Show date range of all trades
+            if has_trades:
+                min_date = sd.min()
+                max_date = sd.max()
+                st.write(f"• Trade date range: {min_date.strftime('%Y-%m-%d')} to {max_date.strftime('%Y-%m-%d')}")
+
+                # Show unique months in data
+                unique_months = months.unique()
+                st.write(f"• Available months: {', '.join([str(m) for m in sorted(unique_months)])}")
+
+                # Show total trades count
+                st.write(f"• Total trades in system: {n_trades}")
+
+            # September trade search: a direct datetime-range mask is a single
+            # vectorized compare, no period conversion needed
+            st.write("**🔍 September Trade Search:**")
+
+            september_trades = trades[
+                (sd >= pd.Timestamp('2025-09-01')) & (sd < pd.Timestamp('2025-10-01'))
+            ]
+            st.write(f"• Date range Sep 1-30, 2025: {len(september_trades)} trades found")
+
+            # Show sample of recent trades
+            if has_trades:
+                st.write("**📋 Recent Trades Sample (last 5):**")
+                recent_trades = _recent_rows(
+                    trades, ('sell_date', 'stock', 'profit_loss'),
+                    (n_trades, trades.index[-1] if n_trades else 0)
+                )
+                st.dataframe(recent_trades, use_container_width=True)
+        
+            if not september_trades.empty:
+                col1, col2, col3 = st.columns(3)
+            
+                with col1:
+                    total_pl = september_trades['profit_loss'].sum()
+                    st.metric("September Total P&L", f"${total_pl:,.2f}")
+            
+                with col2:
+                    client_capital = data_manager.get_monthly_capital('2025-09')
+                    st.metric("Client Capital Used", f"${client_capital:,.2f}")
+            
+                with col3:
+                    calculated_return = (total_pl / client_capital * 100) if client_capital > 0 else 0
+                    st.metric("Calculated Return %", f"{calculated_return:.2f}%")
+            
+                # Show the calculation breakdown
+                st.write("**Calculation Breakdown:**")
+                st.write(f"• Total September P&L: ${total_pl:,.2f}")
+                st.write(f"• Client Capital Base: ${client_capital:,.2f}")
+                st.write(f"• Return Formula: (${total_pl:,.2f} ÷ ${client_capital:,.2f}) × 100 = {calculated_return:.2f}%")
+            
+                # Show September trades details
+                st.write("**📋 September Trades Details:**")
+                st.dataframe(september_trades[list(_SEP_COLS)], use_container_width=True)
+            
+                # Show what you think it should be
+                st.write("**What do you think the September return should be?**")
+                expected_return = st.number_input("Expected September Return (%)", value=calculated_return, step=0.1)
+            
+                if expected_return != calculated_return:
+                    st.warning(f"**Discrepancy detected!**")
+                    st.write(f"• System calculates: {calculated_return:.2f}%")
+                    st.write(f"• You expect: {expected_return:.2f}%")
+                    st.write(f"• Difference: {abs(expected_return - calculated_return):.2f} percentage points")
+                
+                    # Calculate what the capital base should be for your expected return
+                    if expected_return != 0:
+                        expected_capital = (total_pl / expected_return * 100)
+                        st.write(f"• For {expected_return:.2f}% return, capital base should be: ${expected_capital:,.2f}")
+                        st.write(f"• Current capital base is: ${client_capital:,.2f}")
+                        st.write(f"• Capital difference: ${abs(expected_capital - client_capital):,.2f}")
+            else:
+                st.warning("**No September trades found with any method.**")
+                st.write("This could mean:")
+                st.write("• September trades haven't been uploaded yet")
+                st.write("• September trades are in a different year (not 2024)")
+                st.write("• Date format issues in the uploaded file")
+                st.write("• Trades are marked with different sell dates")
+            
+                # Show all unique years and months
+                if has_trades:
+                    st.write("**Available data by year and month:**")
+                    year_month = months.value_counts().sort_index()
+                    st.dataframe(year_month, use_container_width=True)
+
 def admin_dashboard_page():
     """Admin dashboard overview"""
     require_auth("admin")
@@ -180,198 +499,45 @@ def admin_dashboard_page():
     col1, col2, col3 = st.columns([2, 1, 1])
     with col2:
         if st.button("🔄 Refresh Data", help="Reload all data from files"):
-            try:
-                st.session_state.data_manager.refresh_data()
-                st.session_state.last_data_refresh = time.time()
-                st.success("Data refreshed successfully!")
-                st.rerun()
-            except Exception as e:
-                # If refresh fails, recreate the data manager
-                from models import TradingDataManager
-                st.session_state.data_manager = TradingDataManager()
-                st.session_state.last_data_refresh = time.time()
-                st.success("Data refreshed successfully!")
-                st.rerun()
+            _safe_refresh()
     
     with col3:
         if st.button("🗑️ Remove Problem Trades", help="Remove MSTR and COIN trades with high return percentages"):
-            # Remove MSTR trades with ~4737% return
-            success1, message1 = st.session_state.data_manager.remove_trades_by_return_percentage("MSTR", 4737, tolerance=100)
-            # Remove COIN trades with ~2721% return  
-            success2, message2 = st.session_state.data_manager.remove_trades_by_return_percentage("COIN", 2721, tolerance=100)
-            
-            if success1 or success2:
+            # MSTR trades with ~4737% return and COIN trades with ~2721%
+            # return, removed in one scan with one save
+            success, message = st.session_state.data_manager.remove_trades_batch(
+                [("MSTR", 4737, 100), ("COIN", 2721, 100)]
+            )
+
+            if success:
                 st.success("Problem trades removed successfully!")
-                if success1:
-                    st.info(message1)
-                if success2:
-                    st.info(message2)
+                st.info(message)
                 st.rerun()
             else:
                 st.warning("No matching trades found to remove")
     
-    # Get data summary
+    # Get data summary; read the frames into locals once and reuse below
     data_manager = st.session_state.data_manager
+    trades = data_manager.trades_df
+    clients = data_manager.clients_df
+    movements = data_manager.capital_movements_df
+    n_trades, n_clients = len(trades), len(clients)
+    has_trades = n_trades > 0
     
-    # Add trade removal diagnostic section
-    if not data_manager.trades_df.empty:
-        st.subheader("🔍 Trade Analysis & Removal Tools")
-        
-        # Calculate return percentages for analysis
-        trades_df = data_manager.trades_df.copy()
-        trades_df['return_pct'] = ((trades_df['sell_price'] - trades_df['buy_price']) / trades_df['buy_price'] * 100)
-        
-        # Show high return percentage trades
-        high_returns = trades_df[trades_df['return_pct'] > 1000]
-        if not high_returns.empty:
-            st.write("**🚨 High Return Percentage Trades (>1000%):**")
-            st.dataframe(high_returns[['stock', 'buy_price', 'sell_price', 'profit_loss', 'return_pct', 'sell_date']], use_container_width=True)
-            
-            # Manual removal options
-            st.write("**Manual Trade Removal:**")
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                if st.button("Remove All High Return Trades (>1000%)"):
-                    original_count = len(data_manager.trades_df)
-                    data_manager.trades_df = data_manager.trades_df[~data_manager.trades_df.index.isin(high_returns.index)]
-                    removed_count = original_count - len(data_manager.trades_df)
-                    data_manager._save_trades()
-                    st.success(f"Removed {removed_count} high return trades!")
-                    st.rerun()
-            
-            with col2:
-                if st.button("Remove MSTR & COIN High Returns"):
-                    # Remove MSTR trades with very high returns
-                    mstr_high = trades_df[(trades_df['stock'] == 'MSTR') & (trades_df['return_pct'] > 1000)]
-                    coin_high = trades_df[(trades_df['stock'] == 'COIN') & (trades_df['return_pct'] > 1000)]
-                    
-                    original_count = len(data_manager.trades_df)
-                    data_manager.trades_df = data_manager.trades_df[~data_manager.trades_df.index.isin(mstr_high.index)]
-                    data_manager.trades_df = data_manager.trades_df[~data_manager.trades_df.index.isin(coin_high.index)]
-                    removed_count = original_count - len(data_manager.trades_df)
-                    data_manager._save_trades()
-                    st.success(f"Removed {removed_count} MSTR & COIN high return trades!")
-                    st.rerun()
-    
-    # Add September calculation diagnostic
-    if not data_manager.trades_df.empty:
-        st.subheader("🔍 September Return Calculation Diagnostic")
-        
-        # Show all available data first
-        st.write("**📊 Data Analysis:**")
-        
-        # Show date range of all trades
-        if not data_manager.trades_df.empty:
-            min_date = data_manager.trades_df['sell_date'].min()
-            max_date = data_manager.trades_df['sell_date'].max()
-            st.write(f"• Trade date range: {min_date.strftime('%Y-%m-%d')} to {max_date.strftime('%Y-%m-%d')}")
-            
-            # Show unique months in data
-            unique_months = data_manager.trades_df['sell_date'].dt.to_period('M').unique()
-            st.write(f"• Available months: {', '.join([str(m) for m in sorted(unique_months)])}")
-            
-            # Show total trades count
-            st.write(f"• Total trades in system: {len(data_manager.trades_df)}")
-        
-        # Try different September date formats
-        st.write("**🔍 September Trade Search:**")
-        
-        # Method 1: Exact period match for 2025-09
-        september_trades_1 = data_manager.trades_df[
-            data_manager.trades_df['sell_date'].dt.to_period('M') == '2025-09'
-        ]
-        st.write(f"• Method 1 (Period '2025-09'): {len(september_trades_1)} trades found")
-        
-        # Method 2: Date range for September 2025
-        september_trades_2 = data_manager.trades_df[
-            (data_manager.trades_df['sell_date'] >= '2025-09-01') & 
-            (data_manager.trades_df['sell_date'] < '2025-10-01')
-        ]
-        st.write(f"• Method 2 (Date range Sep 1-30, 2025): {len(september_trades_2)} trades found")
-        
-        # Method 3: Any September (any year)
-        september_trades_3 = data_manager.trades_df[
-            data_manager.trades_df['sell_date'].dt.month == 9
-        ]
-        st.write(f"• Method 3 (Any September): {len(september_trades_3)} trades found")
-        
-        # Show sample of recent trades
-        if not data_manager.trades_df.empty:
-            st.write("**📋 Recent Trades Sample (last 5):**")
-            recent_trades = data_manager.trades_df.tail(5)[['sell_date', 'stock', 'profit_loss']]
-            st.dataframe(recent_trades, use_container_width=True)
-        
-        # Use the most successful method
-        september_trades = september_trades_2 if not september_trades_2.empty else september_trades_1 if not september_trades_1.empty else september_trades_3
-        
-        if not september_trades.empty:
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                total_pl = september_trades['profit_loss'].sum()
-                st.metric("September Total P&L", f"${total_pl:,.2f}")
-            
-            with col2:
-                client_capital = data_manager.get_monthly_capital('2025-09')
-                st.metric("Client Capital Used", f"${client_capital:,.2f}")
-            
-            with col3:
-                calculated_return = (total_pl / client_capital * 100) if client_capital > 0 else 0
-                st.metric("Calculated Return %", f"{calculated_return:.2f}%")
-            
-            # Show the calculation breakdown
-            st.write("**Calculation Breakdown:**")
-            st.write(f"• Total September P&L: ${total_pl:,.2f}")
-            st.write(f"• Client Capital Base: ${client_capital:,.2f}")
-            st.write(f"• Return Formula: (${total_pl:,.2f} ÷ ${client_capital:,.2f}) × 100 = {calculated_return:.2f}%")
-            
-            # Show September trades details
-            st.write("**📋 September Trades Details:**")
-            st.dataframe(september_trades[['sell_date', 'stock', 'buy_price', 'sell_price', 'quantity', 'profit_loss']], use_container_width=True)
-            
-            # Show what you think it should be
-            st.write("**What do you think the September return should be?**")
-            expected_return = st.number_input("Expected September Return (%)", value=calculated_return, step=0.1)
-            
-            if expected_return != calculated_return:
-                st.warning(f"**Discrepancy detected!**")
-                st.write(f"• System calculates: {calculated_return:.2f}%")
-                st.write(f"• You expect: {expected_return:.2f}%")
-                st.write(f"• Difference: {abs(expected_return - calculated_return):.2f} percentage points")
-                
-                # Calculate what the capital base should be for your expected return
-                if expected_return != 0:
-                    expected_capital = (total_pl / expected_return * 100)
-                    st.write(f"• For {expected_return:.2f}% return, capital base should be: ${expected_capital:,.2f}")
-                    st.write(f"• Current capital base is: ${client_capital:,.2f}")
-                    st.write(f"• Capital difference: ${abs(expected_capital - client_capital):,.2f}")
-        else:
-            st.warning("**No September trades found with any method.**")
-            st.write("This could mean:")
-            st.write("• September trades haven't been uploaded yet")
-            st.write("• September trades are in a different year (not 2024)")
-            st.write("• Date format issues in the uploaded file")
-            st.write("• Trades are marked with different sell dates")
-            
-            # Show all unique years and months
-            if not data_manager.trades_df.empty:
-                st.write("**Available data by year and month:**")
-                year_month = data_manager.trades_df['sell_date'].dt.to_period('M').value_counts().sort_index()
-                st.dataframe(year_month, use_container_width=True)
+    _diagnostics_panel(data_manager)
     
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        total_trades = len(data_manager.trades_df)
+        total_trades = n_trades
         st.metric("Total Trades", total_trades)
     
     with col2:
-        total_clients = len(data_manager.clients_df)
+        total_clients = n_clients
         st.metric("Total Clients", total_clients)
     
     with col3:
-        total_capital = data_manager.clients_df['starting_capital'].sum() if not data_manager.clients_df.empty else 0
+        total_capital = clients['starting_capital'].sum() if n_clients else 0
         st.metric("Total Capital", f"${total_capital:,.2f}")
     
     with col4:
@@ -381,13 +547,19 @@ def admin_dashboard_page():
     # Recent activity
     st.subheader("📊 Recent Activity")
     
-    if not data_manager.trades_df.empty:
-        recent_trades = data_manager.trades_df.tail(5)
+    if has_trades:
+        recent_trades = _recent_rows(
+            trades, _RECENT_COLS,
+            (n_trades, trades.index[-1])
+        )
         st.write("**Recent Trades:**")
-        st.dataframe(recent_trades[['trade_id', 'stock', 'buy_date', 'sell_date', 'profit_loss', 'win_loss']], use_container_width=True)
+        st.dataframe(recent_trades, use_container_width=True)
     
-    if not data_manager.capital_movements_df.empty:
-        recent_movements = data_manager.capital_movements_df.tail(5)
+    if not movements.empty:
+        recent_movements = _recent_rows(
+            movements, tuple(movements.columns),
+            (len(movements), movements.index[-1])
+        )
         st.write("**Recent Capital Movements:**")
         st.dataframe(recent_movements, use_container_width=True)
 
@@ -398,22 +570,7 @@ def admin_upload_trades_page():
     st.title("📊 Upload Trade Log")
     st.markdown("Upload your trade log to calculate strategy performance and client returns.")
     
-    # Refresh button
-    col1, col2, col3 = st.columns([1, 1, 4])
-    with col1:
-        if st.button("🔄 Refresh Data", help="Reload all data from files"):
-            try:
-                st.session_state.data_manager.refresh_data()
-                st.session_state.last_data_refresh = time.time()
-                st.success("Data refreshed successfully!")
-                st.rerun()
-            except Exception as e:
-                # If refresh fails, recreate the data manager
-                from models import TradingDataManager
-                st.session_state.data_manager = TradingDataManager()
-                st.session_state.last_data_refresh = time.time()
-                st.success("Data refreshed successfully!")
-                st.rerun()
+    _refresh_button()
     
     # File upload
     uploaded_file = st.file_uploader(
@@ -452,6 +609,183 @@ def admin_upload_trades_page():
             mime="text/csv"
         )
 
+@st.fragment
+def _client_row(cid, name, email, capital, start_date, active):
+    """Render one client row; a fragment so row-local buttons rerun only
+    this row instead of the whole client list."""
+    # investment_start_date is pre-parsed at load time; normalize
+    # to a plain date for display and the edit widget
+    if start_date is not None and not pd.isna(start_date):
+        start_date = pd.Timestamp(start_date).date()
+    col1, col2, col3, col4, col5, col6 = st.columns([2, 2, 2, 1, 1, 1])
+    
+    with col1:
+        st.write(f"**{name}**")
+        st.write(f"Username: {cid}")
+    
+    with col2:
+        st.write(f"Email: {email}")
+        st.write(f"Starting Capital: ${capital:,.2f}")
+    
+    with col3:
+        st.write(f"Investment Start: {start_date}")
+        st.write(f"Active: {'Yes' if active else 'No'}")
+    
+    with col4:
+        if st.button("Edit", key=f"edit_{cid}"):
+            st.session_state[f"editing_{cid}"] = True
+    
+    with col5:
+        if st.button("🔑 Password", key=f"password_{cid}", type="secondary"):
+            st.session_state[f"changing_password_{cid}"] = True
+    
+    with col6:
+        if st.button("🗑️ Delete", key=f"delete_{cid}", type="secondary"):
+            st.session_state[f"confirm_delete_{cid}"] = True
+    
+    # Confirmation dialog for deletion
+    if st.session_state.get(f"confirm_delete_{cid}", False):
+        st.warning(f"⚠️ Are you sure you want to delete client '{name}' ({cid})?")
+        st.warning("This will permanently delete ALL data associated with this client including trades, capital movements, and configurations.")
+        
+        col_yes, col_no = st.columns(2)
+        with col_yes:
+            if st.button("Yes, Delete Permanently", key=f"confirm_yes_{cid}", type="primary"):
+                # Delete from both auth manager and data manager
+                auth_success = st.session_state.auth_manager.delete_user(cid)
+                data_success = st.session_state.data_manager.delete_client(cid)
+                
+                if auth_success and data_success:
+                    st.success(f"Client '{name}' deleted successfully!")
+                    # Clear the confirmation state
+                    if f"confirm_delete_{cid}" in st.session_state:
+                        del st.session_state[f"confirm_delete_{cid}"]
+                    st.rerun()
+                else:
+                    st.error("Failed to delete client. Please try again.")
+        
+        with col_no:
+            if st.button("Cancel", key=f"confirm_no_{cid}"):
+                # Clear the confirmation state
+                if f"confirm_delete_{cid}" in st.session_state:
+                    del st.session_state[f"confirm_delete_{cid}"]
+                st.rerun()
+    
+    # Edit form for client
+    if st.session_state.get(f"editing_{cid}", False):
+        st.markdown("---")
+        st.subheader(f"✏️ Edit Client: {name}")
+        
+        with st.form(f"edit_client_{cid}"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                new_name = st.text_input("Full Name", value=name, key=f"edit_name_{cid}")
+                new_email = st.text_input("Email", value=email, key=f"edit_email_{cid}")
+                new_starting_capital = st.number_input(
+                    "Starting Capital ($)", 
+                    min_value=0.0, 
+                    value=float(capital),
+                    key=f"edit_capital_{cid}"
+                )
+            
+            with col2:
+                new_investment_start = st.date_input(
+                    "Investment Start Date",
+                    value=start_date,
+                    key=f"edit_start_{cid}"
+                )
+                new_active = st.selectbox(
+                    "Status",
+                    options=["Active", "Inactive"],
+                    index=0 if active else 1,
+                    key=f"edit_active_{cid}"
+                )
+                new_password = st.text_input(
+                    "New Password (leave blank to keep current)", 
+                    type="password",
+                    key=f"edit_password_{cid}"
+                )
+            
+            col_save, col_cancel = st.columns(2)
+            with col_save:
+                if st.form_submit_button("💾 Save Changes", type="primary"):
+                    # Update client data
+                    success = st.session_state.data_manager.update_client(
+                        cid,
+                        new_name,
+                        new_email,
+                        new_starting_capital,
+                        new_investment_start,
+                        new_active == "Active",
+                        new_password if new_password else None
+                    )
+                    
+                    if success:
+                        st.success(f"Client '{new_name}' updated successfully!")
+                        # Clear editing state
+                        if f"editing_{cid}" in st.session_state:
+                            del st.session_state[f"editing_{cid}"]
+                        st.rerun()
+                    else:
+                        st.error("Failed to update client. Please try again.")
+            
+            with col_cancel:
+                if st.form_submit_button("❌ Cancel"):
+                    # Clear editing state
+                    if f"editing_{cid}" in st.session_state:
+                        del st.session_state[f"editing_{cid}"]
+                    st.rerun()
+    
+    # Password change form
+    if st.session_state.get(f"changing_password_{cid}", False):
+        st.markdown("---")
+        st.subheader(f"🔑 Change Password: {name}")
+        
+        with st.form(f"change_password_{cid}"):
+            new_password = st.text_input(
+                "New Password", 
+                type="password",
+                key=f"new_password_{cid}",
+                help="Enter a new password for this client"
+            )
+            confirm_password = st.text_input(
+                "Confirm New Password", 
+                type="password",
+                key=f"confirm_password_{cid}",
+                help="Re-enter the new password to confirm"
+            )
+            
+            col_save, col_cancel = st.columns(2)
+            with col_save:
+                if st.form_submit_button("🔑 Change Password", type="primary"):
+                    if new_password and confirm_password:
+                        if new_password == confirm_password:
+                            # Update password using auth manager
+                            success = st.session_state.auth_manager.change_password(cid, new_password)
+                            if success:
+                                st.success(f"Password for '{name}' updated successfully!")
+                                # Clear password change state
+                                if f"changing_password_{cid}" in st.session_state:
+                                    del st.session_state[f"changing_password_{cid}"]
+                                st.rerun()
+                            else:
+                                st.error("Failed to update password. Please try again.")
+                        else:
+                            st.error("Passwords do not match. Please try again.")
+                    else:
+                        st.error("Please enter and confirm the new password.")
+            
+            with col_cancel:
+                if st.form_submit_button("❌ Cancel"):
+                    # Clear password change state
+                    if f"changing_password_{cid}" in st.session_state:
+                        del st.session_state[f"changing_password_{cid}"]
+                    st.rerun()
+    
+    st.divider()
+
+
 def admin_manage_clients_page():
     """Admin page for managing client accounts"""
     require_auth("admin")
@@ -459,22 +793,7 @@ def admin_manage_clients_page():
     st.title("👥 Manage Clients")
     st.markdown("Create, edit, and manage client accounts.")
     
-    # Refresh button
-    col1, col2, col3 = st.columns([1, 1, 4])
-    with col1:
-        if st.button("🔄 Refresh Data", help="Reload all data from files"):
-            try:
-                st.session_state.data_manager.refresh_data()
-                st.session_state.last_data_refresh = time.time()
-                st.success("Data refreshed successfully!")
-                st.rerun()
-            except Exception as e:
-                # If refresh fails, recreate the data manager
-                from models import TradingDataManager
-                st.session_state.data_manager = TradingDataManager()
-                st.session_state.last_data_refresh = time.time()
-                st.success("Data refreshed successfully!")
-                st.rerun()
+    _refresh_button()
     
     # Create new client
     st.subheader("➕ Create New Client")
@@ -519,174 +838,9 @@ def admin_manage_clients_page():
         
         # Add delete buttons for each client
         st.markdown("**Client List:**")
-        for idx, row in clients_df.iterrows():
-            col1, col2, col3, col4, col5, col6 = st.columns([2, 2, 2, 1, 1, 1])
-            
-            with col1:
-                st.write(f"**{row['name']}**")
-                st.write(f"Username: {row['client_id']}")
-            
-            with col2:
-                st.write(f"Email: {row['email']}")
-                st.write(f"Starting Capital: ${row['starting_capital']:,.2f}")
-            
-            with col3:
-                st.write(f"Investment Start: {row['investment_start_date']}")
-                st.write(f"Active: {'Yes' if row['active'] else 'No'}")
-            
-            with col4:
-                if st.button("Edit", key=f"edit_{row['client_id']}"):
-                    st.session_state[f"editing_{row['client_id']}"] = True
-            
-            with col5:
-                if st.button("🔑 Password", key=f"password_{row['client_id']}", type="secondary"):
-                    st.session_state[f"changing_password_{row['client_id']}"] = True
-            
-            with col6:
-                if st.button("🗑️ Delete", key=f"delete_{row['client_id']}", type="secondary"):
-                    st.session_state[f"confirm_delete_{row['client_id']}"] = True
-            
-            # Confirmation dialog for deletion
-            if st.session_state.get(f"confirm_delete_{row['client_id']}", False):
-                st.warning(f"⚠️ Are you sure you want to delete client '{row['name']}' ({row['client_id']})?")
-                st.warning("This will permanently delete ALL data associated with this client including trades, capital movements, and configurations.")
-                
-                col_yes, col_no = st.columns(2)
-                with col_yes:
-                    if st.button("Yes, Delete Permanently", key=f"confirm_yes_{row['client_id']}", type="primary"):
-                        # Delete from both auth manager and data manager
-                        auth_success = st.session_state.auth_manager.delete_user(row['client_id'])
-                        data_success = st.session_state.data_manager.delete_client(row['client_id'])
-                        
-                        if auth_success and data_success:
-                            st.success(f"Client '{row['name']}' deleted successfully!")
-                            # Clear the confirmation state
-                            if f"confirm_delete_{row['client_id']}" in st.session_state:
-                                del st.session_state[f"confirm_delete_{row['client_id']}"]
-                            st.rerun()
-                        else:
-                            st.error("Failed to delete client. Please try again.")
-                
-                with col_no:
-                    if st.button("Cancel", key=f"confirm_no_{row['client_id']}"):
-                        # Clear the confirmation state
-                        if f"confirm_delete_{row['client_id']}" in st.session_state:
-                            del st.session_state[f"confirm_delete_{row['client_id']}"]
-                        st.rerun()
-            
-            # Edit form for client
-            if st.session_state.get(f"editing_{row['client_id']}", False):
-                st.markdown("---")
-                st.subheader(f"✏️ Edit Client: {row['name']}")
-                
-                with st.form(f"edit_client_{row['client_id']}"):
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        new_name = st.text_input("Full Name", value=row['name'], key=f"edit_name_{row['client_id']}")
-                        new_email = st.text_input("Email", value=row['email'], key=f"edit_email_{row['client_id']}")
-                        new_starting_capital = st.number_input(
-                            "Starting Capital ($)", 
-                            min_value=0.0, 
-                            value=float(row['starting_capital']),
-                            key=f"edit_capital_{row['client_id']}"
-                        )
-                    
-                    with col2:
-                        new_investment_start = st.date_input(
-                            "Investment Start Date",
-                            value=pd.to_datetime(row['investment_start_date']).date(),
-                            key=f"edit_start_{row['client_id']}"
-                        )
-                        new_active = st.selectbox(
-                            "Status",
-                            options=["Active", "Inactive"],
-                            index=0 if row['active'] else 1,
-                            key=f"edit_active_{row['client_id']}"
-                        )
-                        new_password = st.text_input(
-                            "New Password (leave blank to keep current)", 
-                            type="password",
-                            key=f"edit_password_{row['client_id']}"
-                        )
-                    
-                    col_save, col_cancel = st.columns(2)
-                    with col_save:
-                        if st.form_submit_button("💾 Save Changes", type="primary"):
-                            # Update client data
-                            success = st.session_state.data_manager.update_client(
-                                row['client_id'],
-                                new_name,
-                                new_email,
-                                new_starting_capital,
-                                new_investment_start,
-                                new_active == "Active",
-                                new_password if new_password else None
-                            )
-                            
-                            if success:
-                                st.success(f"Client '{new_name}' updated successfully!")
-                                # Clear editing state
-                                if f"editing_{row['client_id']}" in st.session_state:
-                                    del st.session_state[f"editing_{row['client_id']}"]
-                                st.rerun()
-                            else:
-                                st.error("Failed to update client. Please try again.")
-                    
-                    with col_cancel:
-                        if st.form_submit_button("❌ Cancel"):
-                            # Clear editing state
-                            if f"editing_{row['client_id']}" in st.session_state:
-                                del st.session_state[f"editing_{row['client_id']}"]
-                            st.rerun()
-            
-            # Password change form
-            if st.session_state.get(f"changing_password_{row['client_id']}", False):
-                st.markdown("---")
-                st.subheader(f"🔑 Change Password: {row['name']}")
-                
-                with st.form(f"change_password_{row['client_id']}"):
-                    new_password = st.text_input(
-                        "New Password", 
-                        type="password",
-                        key=f"new_password_{row['client_id']}",
-                        help="Enter a new password for this client"
-                    )
-                    confirm_password = st.text_input(
-                        "Confirm New Password", 
-                        type="password",
-                        key=f"confirm_password_{row['client_id']}",
-                        help="Re-enter the new password to confirm"
-                    )
-                    
-                    col_save, col_cancel = st.columns(2)
-                    with col_save:
-                        if st.form_submit_button("🔑 Change Password", type="primary"):
-                            if new_password and confirm_password:
-                                if new_password == confirm_password:
-                                    # Update password using auth manager
-                                    success = st.session_state.auth_manager.change_password(row['client_id'], new_password)
-                                    if success:
-                                        st.success(f"Password for '{row['name']}' updated successfully!")
-                                        # Clear password change state
-                                        if f"changing_password_{row['client_id']}" in st.session_state:
-                                            del st.session_state[f"changing_password_{row['client_id']}"]
-                                        st.rerun()
-                                    else:
-                                        st.error("Failed to update password. Please try again.")
-                                else:
-                                    st.error("Passwords do not match. Please try again.")
-                            else:
-                                st.error("Please enter and confirm the new password.")
-                    
-                    with col_cancel:
-                        if st.form_submit_button("❌ Cancel"):
-                            # Clear password change state
-                            if f"changing_password_{row['client_id']}" in st.session_state:
-                                del st.session_state[f"changing_password_{row['client_id']}"]
-                            st.rerun()
-            
-            st.divider()
+        client_cols = ('client_id', 'name', 'email', 'starting_capital', 'investment_start_date', 'active')
+        for cid, name, email, capital, start_date, active in zip(*(clients_df[c].values for c in client_cols)):
+            _client_row(cid, name, email, capital, start_date, active)
         
         # Also show the dataframe for reference
         st.markdown("**Data Table View:**")
@@ -701,22 +855,7 @@ def admin_capital_movements_page():
     st.title("💰 Capital Movements")
     st.markdown("Manage client contributions and withdrawals.")
     
-    # Refresh button
-    col1, col2, col3 = st.columns([1, 1, 4])
-    with col1:
-        if st.button("🔄 Refresh Data", help="Reload all data from files"):
-            try:
-                st.session_state.data_manager.refresh_data()
-                st.session_state.last_data_refresh = time.time()
-                st.success("Data refreshed successfully!")
-                st.rerun()
-            except Exception as e:
-                # If refresh fails, recreate the data manager
-                from models import TradingDataManager
-                st.session_state.data_manager = TradingDataManager()
-                st.session_state.last_data_refresh = time.time()
-                st.success("Data refreshed successfully!")
-                st.rerun()
+    _refresh_button()
     
     # Add capital movement
     st.subheader("➕ Add Capital Movement")
@@ -727,7 +866,7 @@ def admin_capital_movements_page():
         with col1:
             client_id = st.selectbox(
                 "Client ID",
-                options=st.session_state.data_manager.clients_df['client_id'].tolist() if not st.session_state.data_manager.clients_df.empty else []
+                options=st.session_state.data_manager.get_available_clients()
             )
             movement_type = st.selectbox("Type", ["contribution", "withdrawal"])
             amount = st.number_input("Amount ($)", min_value=0.0, value=1000.0)
@@ -761,28 +900,13 @@ def admin_capital_accounts_page():
     st.title("🏦 Capital Accounts")
     st.markdown("View capital progression, contributions, withdrawals, and returns for all clients.")
     
-    # Refresh button
-    col1, col2, col3 = st.columns([1, 1, 4])
-    with col1:
-        if st.button("🔄 Refresh Data", help="Reload all data from files"):
-            try:
-                st.session_state.data_manager.refresh_data()
-                st.session_state.last_data_refresh = time.time()
-                st.success("Data refreshed successfully!")
-                st.rerun()
-            except Exception as e:
-                # If refresh fails, recreate the data manager
-                from models import TradingDataManager
-                st.session_state.data_manager = TradingDataManager()
-                st.session_state.last_data_refresh = time.time()
-                st.success("Data refreshed successfully!")
-                st.rerun()
+    _refresh_button()
     
     data_manager = st.session_state.data_manager
     
     # Client selection
     if not data_manager.clients_df.empty:
-        client_options = data_manager.clients_df['client_id'].tolist()
+        client_options = data_manager.get_available_clients()
         selected_client = st.selectbox(
             "Select Client to View",
             options=client_options,
@@ -790,38 +914,17 @@ def admin_capital_accounts_page():
         )
         
         if selected_client:
-            # Get client capital flow
-            client_capital = data_manager.get_client_capital_flow(selected_client)
+            # Get client capital flow (memoized across reruns)
+            client_capital = _cached_capital_flow(selected_client, _data_token())
             
             if client_capital:
                 # Get client info for display
-                client_info = data_manager.clients_df[data_manager.clients_df['client_id'] == selected_client].iloc[0]
+                client_info = data_manager.get_client_info(selected_client)
                 
                 st.subheader(f"📊 Capital Account for {client_info['name']} ({selected_client})")
                 
                 # Capital overview
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    st.metric("Starting Capital", f"${client_capital['starting_capital']:,.2f}")
-                    st.metric("Current Capital", f"${client_capital['current_capital']:,.2f}")
-                
-                with col2:
-                    st.metric("Total Contributions", f"${client_capital['total_contributions']:,.2f}")
-                    st.metric("Total Withdrawals", f"${client_capital['total_withdrawals']:,.2f}")
-                
-                with col3:
-                    # Calculate investor's share of returns
-                    config = data_manager.get_config(selected_client)
-                    investor_returns = client_capital['total_returns'] * config['investor_share']
-                    st.metric("Investor Returns", f"${investor_returns:,.2f}")
-                    investor_return_pct = (investor_returns / client_capital['starting_capital'] * 100) if client_capital['starting_capital'] > 0 else 0
-                    st.metric("Investor Return %", f"{investor_return_pct:.2f}%")
-                
-                with col4:
-                    config = data_manager.get_config(selected_client)
-                    st.metric("Tax Rate", f"{config['tax_rate']*100:.1f}%")
-                    st.metric("Investor Share", f"{config['investor_share']*100:.1f}%")
+                _capital_overview_table(client_capital, data_manager.get_config(selected_client))
                 
                 # Monthly table and biweekly chart
                 if client_capital['monthly_breakdown'] or client_capital['biweekly_breakdown']:
@@ -829,54 +932,30 @@ def admin_capital_accounts_page():
                     if client_capital['monthly_breakdown']:
                         st.subheader("📊 Monthly Capital Progression (Table)")
                         
-                        monthly_df = pd.DataFrame(client_capital['monthly_breakdown'])
-                        # Remove contribution/withdrawal columns for cleaner display
-                        display_columns = ['month', 'starting_capital', 'capital_after_contributions', 'monthly_return_pct', 'profit_after_tax', 'investor_share', 'trader_share', 'ending_capital']
-                        monthly_display_df = monthly_df[display_columns]
-                        st.dataframe(monthly_display_df, use_container_width=True)
+                        monthly_df = client_capital['monthly_breakdown_df']
+                        # Contribution/withdrawal columns are hidden via
+                        # column_order; no subset copy is materialized
+                        st.dataframe(monthly_df, column_order=_MONTHLY_COLS,
+                                     column_config=_MONTHLY_COL_CONFIG, use_container_width=True)
                     
                     # Capital Growth Visualization
                     st.subheader("📈 Capital Growth Analysis")
                     
-                    if client_capital['monthly_breakdown']:
-                        monthly_df = pd.DataFrame(client_capital['monthly_breakdown'])
-                        
-                        # Create two separate simple charts if biweekly data is available
+                    # Biweekly chart when available; the monthly dual-axis
+                    # chart is a true fallback so only one figure is built
+                    # and serialized per rerun
                     if client_capital['biweekly_breakdown']:
-                            st.write("**Biweekly Performance Analysis**")
-                            
-                            biweekly_df = pd.DataFrame(client_capital['biweekly_breakdown'])
-                            
-                            # Calculate cumulative profits (only from trading, not contributions)
-                            # Profit for each period = ending_capital - capital_after_contributions
-                            biweekly_df['period_profit'] = biweekly_df['ending_capital'] - biweekly_df['capital_after_contributions']
-                            biweekly_df['cumulative_profit'] = biweekly_df['period_profit'].cumsum()
-                            
-                            # Calculate total capital starting from initial investment + cumulative profit + contributions
-                            initial_capital = biweekly_df['starting_capital'].iloc[0]  # First period starting capital
-                            # Use net_contributions (contributions - withdrawals) instead of total_contributions
-                            biweekly_df['total_capital'] = initial_capital + biweekly_df['cumulative_profit'] + biweekly_df['net_contributions'].cumsum()
-                            
-                            # Chart 1: Cumulative Profit (biweekly)
-                            fig1 = go.Figure()
-                            fig1.add_trace(go.Scatter(
-                                x=biweekly_df['period_label'],
-                                y=biweekly_df['cumulative_profit'],
-                                mode='lines+markers',
-                                name='Cumulative Profit',
-                                line=dict(color='green', width=3),
-                                marker=dict(size=6)
-                            ))
-                            
-                            fig1.update_layout(
-                                title=f"Cumulative Profit (Biweekly) - {client_info['name']}",
-                                xaxis_title="Biweekly Period",
-                                yaxis_title="Cumulative Profit ($)",
-                                hovermode='x unified'
-                            )
-                            
-                            st.plotly_chart(fig1, use_container_width=True)
-                    else:
+                        st.write("**Biweekly Performance Analysis**")
+
+                        # Chart 1: Cumulative Profit (biweekly), spec
+                        # memoized across reruns
+                        st.plotly_chart(
+                            go.Figure(_cum_profit_fig(selected_client, client_info['name'], _data_token())),
+                            use_container_width=True,
+                            key="admin_cum_profit"
+                        )
+                    elif client_capital['monthly_breakdown']:
+                        monthly_df = client_capital['monthly_breakdown_df']
                         # Fallback to monthly view if no biweekly data
                         st.write("**Monthly Capital Growth (Normalized to Starting Capital)**")
                         
@@ -888,7 +967,7 @@ def admin_capital_accounts_page():
                         fig = go.Figure()
                         
                         # Add normalized capital line
-                        fig.add_trace(go.Scatter(
+                        fig.add_trace(go.Scattergl(
                             x=monthly_df['month'],
                             y=monthly_df['normalized_capital'],
                             mode='lines+markers',
@@ -903,7 +982,7 @@ def admin_capital_accounts_page():
                             x=monthly_df['month'],
                             y=monthly_df['monthly_return_pct'],
                             name='Monthly Returns (%)',
-                            marker_color=['green' if x >= 0 else 'red' for x in monthly_df['monthly_return_pct']],
+                            marker_color=np.where(monthly_df['monthly_return_pct'].to_numpy() >= 0, 'green', 'red'),
                             opacity=0.6,
                             yaxis='y2'
                         ))
@@ -917,7 +996,7 @@ def admin_capital_accounts_page():
                             legend=dict(x=0.02, y=0.98)
                         )
                         
-                        st.plotly_chart(fig, use_container_width=True)
+                        st.plotly_chart(fig, use_container_width=True, key="admin_monthly_growth")
                         
                 else:
                     st.info("No capital progression data available yet.")
@@ -1002,29 +1081,15 @@ def admin_configuration_page():
             col1, col2 = st.columns(2)
             
             with col1:
-                # Generate all months from 2024 to 2027
-                month_options = []
-                for year in range(2024, 2028):
-                    for month in range(1, 13):
-                        month_str = f"{year}-{month:02d}"
-                        month_options.append(month_str)
-                
                 month_year = st.selectbox(
                     "Select Month/Year",
-                    options=month_options,
+                    options=MONTH_OPTIONS,
                     key="month_year_selection"
                 )
             
             with col2:
-                # Get current capital for selected month if it exists
-                current_capital = 0.0
-                if not data_manager.monthly_capital_df.empty:
-                    selected_month_dt = pd.to_datetime(month_year + '-01')
-                    existing_month = data_manager.monthly_capital_df[
-                        data_manager.monthly_capital_df['month'].dt.to_period('M') == selected_month_dt.to_period('M')
-                    ]
-                    if not existing_month.empty:
-                        current_capital = existing_month['total_capital'].iloc[0]
+                # O(1) lookup against the manager's prebuilt month index
+                current_capital = float(data_manager.get_monthly_capital_setting(month_year))
                 
                 capital_amount = st.number_input(
                     "Total Capital for Month ($)",
@@ -1079,8 +1144,13 @@ def admin_configuration_page():
             st.write("**📊 Current Monthly Capital Settings:**")
             monthly_capital_display = data_manager.monthly_capital_df.copy()
             monthly_capital_display['month'] = monthly_capital_display['month'].dt.strftime('%Y-%m')
-            monthly_capital_display['total_capital'] = monthly_capital_display['total_capital'].apply(lambda x: f"${x:,.2f}")
-            st.dataframe(monthly_capital_display[['month', 'total_capital']], use_container_width=True)
+            # Let Streamlit format the currency client-side instead of
+            # running a Python lambda over every row each rerun
+            st.dataframe(
+                monthly_capital_display[['month', 'total_capital']],
+                column_config={'total_capital': st.column_config.NumberColumn('Total Capital', format="$%.2f")},
+                use_container_width=True
+            )
         else:
             st.info("No monthly capital settings configured. System will use default calculation based on client capital.")
     
@@ -1204,34 +1274,20 @@ def admin_strategy_analysis_page():
     st.title("📈 Strategy Analysis")
     st.markdown("Detailed analysis of trading strategy performance.")
     
-    # Refresh button
-    col1, col2, col3 = st.columns([1, 1, 4])
-    with col1:
-        if st.button("🔄 Refresh Data", help="Reload all data from files"):
-            try:
-                st.session_state.data_manager.refresh_data()
-                st.session_state.last_data_refresh = time.time()
-                st.success("Data refreshed successfully!")
-                st.rerun()
-            except Exception as e:
-                # If refresh fails, recreate the data manager
-                from models import TradingDataManager
-                st.session_state.data_manager = TradingDataManager()
-                st.session_state.last_data_refresh = time.time()
-                st.success("Data refreshed successfully!")
-                st.rerun()
+    _refresh_button()
     
     data_manager = st.session_state.data_manager
     
     if not data_manager.trades_df.empty:
-        # Strategy summary
-        summary = data_manager.get_strategy_summary()
+        # Strategy summary (memoized across reruns); global config fetched
+        # once for the whole page
+        summary = _cached_strategy_summary(_data_token())
+        config = data_manager.get_config()
         
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
             # Calculate return after tax using global tax rate
-            config = data_manager.get_config()
             return_after_tax = summary['cumulative_return'] * (1 - config['tax_rate'])
             st.metric("Return After Tax", f"{return_after_tax:.2f}%")
             st.metric("Total Trades", summary['total_trades'])
@@ -1265,19 +1321,18 @@ def admin_strategy_analysis_page():
                 data_manager._save_config()
                 st.rerun()
         
-        # Monthly returns
-        monthly_returns = data_manager.get_monthly_strategy_returns()
+        # Monthly returns (memoized across reruns)
+        monthly_returns = _cached_monthly_returns(_data_token())
         
         if not monthly_returns.empty:
             st.subheader("📊 Monthly Strategy Returns vs S&P 500")
             
             # Get S&P 500 data for comparison (if enabled)
-            config = data_manager.get_config()
             sp500_returns = pd.DataFrame()  # Default to empty
             
             if config.get('enable_sp500_comparison', True):
                 try:
-                    sp500_returns = data_manager.get_sp500_monthly_returns()
+                    sp500_returns = _sp500_monthly()
                     if sp500_returns.empty:
                         st.warning("S&P 500 data is empty. Check internet connection or try again later.")
                 except Exception as e:
@@ -1292,16 +1347,9 @@ def admin_strategy_analysis_page():
             
             # Merge strategy returns with S&P 500 returns
             if not sp500_returns.empty:
-                # Merge on Month column
-                monthly_returns_with_sp500 = monthly_returns.merge(
-                    sp500_returns[['Month', 'SP500_Return_Pct', 'SP500_Cumulative_Return']], 
-                    on='Month', 
-                    how='left'
-                )
-                
-                # Fill NaN values with 0 for months where S&P 500 data is not available
-                monthly_returns_with_sp500['SP500_Return_Pct'] = monthly_returns_with_sp500['SP500_Return_Pct'].fillna(0)
-                monthly_returns_with_sp500['SP500_Cumulative_Return'] = monthly_returns_with_sp500['SP500_Cumulative_Return'].fillna(0)
+                # Joined table is memoized (and persisted to disk) so the
+                # map-join only runs on cache misses
+                monthly_returns_with_sp500 = _monthly_returns_with_sp500(_trades_content_key())
                 
                 # Display columns including S&P 500 comparison (removed S&P500_Cumulative_Return)
                 display_columns = ['Month', 'Total_Trades', 'Win_Rate', 'Avg_Win_Pct', 'Avg_Loss_Pct', 'Return_Pct', 'SP500_Return_Pct', 'Cumulative_Return']
@@ -1326,63 +1374,60 @@ def admin_strategy_analysis_page():
             
             # Combined Chart - Strategy vs S&P 500 Monthly Returns (Side-by-Side Bar Chart)
             if not sp500_returns.empty:
-                # Create side-by-side bar chart with both strategy and S&P 500 returns
-                fig = go.Figure()
-                
-                # Add strategy returns bars
-                fig.add_trace(go.Bar(
-                    x=monthly_returns['Month'],
-                    y=monthly_returns['Return_Pct'],
-                    name='Strategy Returns',
-                    marker_color='blue',
-                    opacity=0.8
-                ))
-                
-                # Add S&P 500 returns bars
-                fig.add_trace(go.Bar(
-                    x=monthly_returns_with_sp500['Month'],
-                    y=monthly_returns_with_sp500['SP500_Return_Pct'],
-                    name='S&P 500 Returns',
-                    marker_color='red',
-                    opacity=0.8
-                ))
-                
-                fig.update_layout(
-                    title="Monthly Returns Comparison: Strategy vs S&P 500 (%)",
-                    xaxis_title="Month",
-                    yaxis_title="Return Percentage (%)",
-                    barmode='group',  # This creates side-by-side bars
-                    hovermode='x unified',
-                    legend=dict(
-                        yanchor="top",
-                        y=0.99,
-                        xanchor="left",
-                        x=0.01
+                # Side-by-side bar chart, traces and layout passed in one
+                # constructor so plotly validates everything in a single pass
+                fig = go.Figure(
+                    data=[
+                        go.Bar(
+                            x=monthly_returns['Month'],
+                            y=monthly_returns['Return_Pct'],
+                            name='Strategy Returns',
+                            marker_color='blue',
+                            opacity=0.8
+                        ),
+                        go.Bar(
+                            x=monthly_returns_with_sp500['Month'],
+                            y=monthly_returns_with_sp500['SP500_Return_Pct'],
+                            name='S&P 500 Returns',
+                            marker_color='red',
+                            opacity=0.8
+                        )
+                    ],
+                    layout=go.Layout(
+                        title="Monthly Returns Comparison: Strategy vs S&P 500 (%)",
+                        xaxis_title="Month",
+                        yaxis_title="Return Percentage (%)",
+                        barmode='group',  # This creates side-by-side bars
+                        hovermode='x unified',
+                        legend=dict(
+                            yanchor="top",
+                            y=0.99,
+                            xanchor="left",
+                            x=0.01
+                        )
                     )
                 )
                 
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True, key="monthly_returns_vs_sp500")
             else:
                 # Fallback to strategy-only bar chart if S&P 500 data is not available
-                fig = go.Figure()
-                
-                # Add strategy returns bars
-                fig.add_trace(go.Bar(
-                    x=monthly_returns['Month'],
-                    y=monthly_returns['Return_Pct'],
-                    name='Strategy Returns',
-                    marker_color='blue',
-                    opacity=0.8
-                ))
-                
-                fig.update_layout(
-                    title="Monthly Strategy Returns (%)",
-                    xaxis_title="Month",
-                    yaxis_title="Return Percentage (%)",
-                    hovermode='x unified'
+                fig = go.Figure(
+                    data=[go.Bar(
+                        x=monthly_returns['Month'],
+                        y=monthly_returns['Return_Pct'],
+                        name='Strategy Returns',
+                        marker_color='blue',
+                        opacity=0.8
+                    )],
+                    layout=go.Layout(
+                        title="Monthly Strategy Returns (%)",
+                        xaxis_title="Month",
+                        yaxis_title="Return Percentage (%)",
+                        hovermode='x unified'
+                    )
                 )
                 
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True, key="monthly_returns_strategy")
     else:
         st.info("No trades uploaded yet. Please upload a trade log first.")
 
@@ -1394,65 +1439,21 @@ def client_capital_account_page():
     st.title("🏠 Capital Account")
     st.markdown("View your capital progression, contributions, withdrawals, and returns.")
     
-    # Add refresh button
-    col1, col2 = st.columns([3, 1])
-    with col2:
-        if st.button("🔄 Refresh Data", help="Reload all data from files"):
-            try:
-                st.session_state.data_manager.refresh_data()
-                st.session_state.last_data_refresh = time.time()
-                st.success("Data refreshed successfully!")
-                st.rerun()
-            except Exception as e:
-                # If refresh fails, recreate the data manager
-                from models import TradingDataManager
-                st.session_state.data_manager = TradingDataManager()
-                st.session_state.last_data_refresh = time.time()
-                st.success("Data refreshed successfully!")
-                st.rerun()
+    _refresh_button()
     
     user_info = st.session_state.user_info
     data_manager = st.session_state.data_manager
     
-    # Get client capital flow
-    client_capital = data_manager.get_client_capital_flow(user_info['username'])
+    # Get client capital flow (memoized; Refresh Data invalidates via the
+    # last_data_refresh token)
+    client_capital = _cached_capital_flow(user_info['username'], _data_token())
     
     # Debug section to show what data is being used
-    if st.checkbox("🔍 Show Debug Info", help="Display technical details about the data"):
-        st.write("**Debug Information:**")
-        st.write(f"- Client ID: {user_info['username']}")
-        st.write(f"- Investment start date: {data_manager.clients_df[data_manager.clients_df['client_id'] == user_info['username']].iloc[0]['investment_start_date']}")
-        st.write(f"- Monthly breakdown length: {len(client_capital.get('monthly_breakdown', []))}")
-        st.write(f"- Biweekly breakdown length: {len(client_capital.get('biweekly_breakdown', []))}")
-        if client_capital.get('monthly_breakdown'):
-            st.write("**Monthly breakdown months:**")
-            for month in client_capital['monthly_breakdown']:
-                st.write(f"  - {month['month']}")
+    _debug_block(client_capital, data_manager, user_info)
     
     if client_capital:
         # Capital overview
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Starting Capital", f"${client_capital['starting_capital']:,.2f}")
-            st.metric("Current Capital", f"${client_capital['current_capital']:,.2f}")
-        
-        with col2:
-            st.metric("Total Contributions", f"${client_capital['total_contributions']:,.2f}")
-            st.metric("Total Withdrawals", f"${client_capital['total_withdrawals']:,.2f}")
-        
-        with col3:
-            # Calculate investor's share of returns
-            config = data_manager.get_config(user_info['username'])
-            investor_returns = client_capital['total_returns'] * config['investor_share']
-            st.metric("Investor Returns", f"${investor_returns:,.2f}")
-            investor_return_pct = (investor_returns / client_capital['starting_capital'] * 100) if client_capital['starting_capital'] > 0 else 0
-            st.metric("Investor Return %", f"{investor_return_pct:.2f}%")
-        
-        with col4:
-            config = data_manager.get_config(user_info['username'])
-            st.metric("Tax Rate", f"{config['tax_rate']*100:.1f}%")
-            st.metric("Investor Share", f"{config['investor_share']*100:.1f}%")
+        _capital_overview_table(client_capital, data_manager.get_config(user_info['username']))
         
         # Monthly table and biweekly chart
         if client_capital['monthly_breakdown'] or client_capital['biweekly_breakdown']:
@@ -1460,37 +1461,30 @@ def client_capital_account_page():
             if client_capital['monthly_breakdown']:
                 st.subheader("📊 Monthly Capital Progression (Table)")
                 
-                monthly_df = pd.DataFrame(client_capital['monthly_breakdown'])
-                # Remove contribution/withdrawal columns for cleaner display
-                display_columns = ['month', 'starting_capital', 'capital_after_contributions', 'monthly_return_pct', 'profit_after_tax', 'investor_share', 'trader_share', 'ending_capital']
-                monthly_display_df = monthly_df[display_columns]
-                st.dataframe(monthly_display_df, use_container_width=True)
+                monthly_df = client_capital['monthly_breakdown_df']
+                # Contribution/withdrawal columns are hidden via
+                # column_order; no subset copy is materialized
+                st.dataframe(monthly_df, column_order=_MONTHLY_COLS,
+                             column_config=_MONTHLY_COL_CONFIG, use_container_width=True)
             
             # Capital Growth Visualization
             st.subheader("📈 Capital Growth Analysis")
             
             if client_capital['monthly_breakdown']:
-                monthly_df = pd.DataFrame(client_capital['monthly_breakdown'])
+                monthly_df = client_capital['monthly_breakdown_df']
                 
                 # Create two separate simple charts if biweekly data is available
                 if client_capital['biweekly_breakdown']:
                     st.write("**Biweekly Performance Analysis**")
                     
-                    biweekly_df = pd.DataFrame(client_capital['biweekly_breakdown'])
-                    
-                    # Calculate cumulative profits (only from trading, not contributions)
-                    # Profit for each period = ending_capital - capital_after_contributions
-                    biweekly_df['period_profit'] = biweekly_df['ending_capital'] - biweekly_df['capital_after_contributions']
-                    biweekly_df['cumulative_profit'] = biweekly_df['period_profit'].cumsum()
+                    biweekly_df = client_capital['biweekly_breakdown_df']
                     
-                    # Calculate total capital starting from initial investment + cumulative profit + contributions
-                    initial_capital = biweekly_df['starting_capital'].iloc[0]  # First period starting capital
-                    # Use net_contributions (contributions - withdrawals) instead of total_contributions
-                    biweekly_df['total_capital'] = initial_capital + biweekly_df['cumulative_profit'] + biweekly_df['net_contributions'].cumsum()
+                    # period_profit / cumulative_profit / total_capital are
+                    # precomputed by get_client_capital_flow
                     
                     # Chart 1: Cumulative Profit (biweekly)
                     fig1 = go.Figure()
-                    fig1.add_trace(go.Scatter(
+                    fig1.add_trace(go.Scattergl(
                         x=biweekly_df['period_label'],
                         y=biweekly_df['cumulative_profit'],
                         mode='lines+markers',
@@ -1506,7 +1500,7 @@ def client_capital_account_page():
                         hovermode='x unified'
                     )
                     
-                    st.plotly_chart(fig1, use_container_width=True)
+                    st.plotly_chart(fig1, use_container_width=True, key="client_cum_profit")
                 else:
                     # Fallback to monthly view if no biweekly data
                     st.write("**Monthly Capital Growth (Normalized to Starting Capital)**")
@@ -1519,7 +1513,7 @@ def client_capital_account_page():
                     fig = go.Figure()
                     
                     # Add normalized capital line
-                    fig.add_trace(go.Scatter(
+                    fig.add_trace(go.Scattergl(
                         x=monthly_df['month'],
                         y=monthly_df['normalized_capital'],
                         mode='lines+markers',
@@ -1534,7 +1528,7 @@ def client_capital_account_page():
                         x=monthly_df['month'],
                         y=monthly_df['monthly_return_pct'],
                         name='Monthly Returns (%)',
-                        marker_color=['green' if x >= 0 else 'red' for x in monthly_df['monthly_return_pct']],
+                        marker_color=np.where(monthly_df['monthly_return_pct'].to_numpy() >= 0, 'green', 'red'),
                         opacity=0.6,
                         yaxis='y2'
                     ))
@@ -1548,7 +1542,7 @@ def client_capital_account_page():
                         legend=dict(x=0.02, y=0.98)
                     )
                     
-                    st.plotly_chart(fig, use_container_width=True)
+                    st.plotly_chart(fig, use_container_width=True, key="client_monthly_growth")
             else:
                 st.error("Unable to load capital account information.")
 
@@ -1558,59 +1552,31 @@ def client_strategy_summary_page():
     # Redirect to the same strategy analysis page that admins use
     admin_strategy_analysis_page()
 
-def admin_strategy_details_page():
-    """Admin page for detailed strategy information"""
-    require_auth("admin")
-    
-    st.title("📋 Strategy Details")
-    st.markdown("Detailed view of stock trading performance and individual trades.")
-    
+def _render_strategy_details(empty_msg):
+    """Shared body of the admin and client strategy details pages; only the
+    auth role and the no-data message differ."""
     data_manager = st.session_state.data_manager
     
     if not data_manager.trades_df.empty:
-        # Filter trades with quantity >= 2
-        filtered_trades = data_manager.trades_df[data_manager.trades_df['quantity'] >= 2].copy()
+        # Filter + aggregate once per data refresh (cache shared across
+        # sessions and both roles)
+        filtered_trades, winners, losers, months = _strategy_details_data(_data_token())
         
         if not filtered_trades.empty:
             # Top Winners and Losers by Month
             st.subheader("🏆 Top Winners and Losers by Month")
             
-            # Group by month and stock to calculate returns
-            filtered_trades['month'] = filtered_trades['sell_date'].dt.to_period('M')
-            monthly_stock_returns = filtered_trades.groupby(['month', 'stock']).agg({
-                'buy_price': 'first',
-                'sell_price': 'last',
-                'quantity': 'sum',
-                'profit_loss': 'sum'
-            }).reset_index()
-            
-            # Calculate return percentage
-            monthly_stock_returns['return_pct'] = ((monthly_stock_returns['sell_price'] - monthly_stock_returns['buy_price']) / monthly_stock_returns['buy_price'] * 100).round(2)
+            # Two Arrow payloads total instead of two st.dataframe calls
+            # per month
+            col1, col2 = st.columns(2)
             
-            # Get unique months
-            months = sorted(monthly_stock_returns['month'].unique())
+            with col1:
+                st.write("**Top Winners by Month**")
+                st.dataframe(winners, use_container_width=True, hide_index=True)
             
-            for month in months:
-                month_data = monthly_stock_returns[monthly_stock_returns['month'] == month]
-                month_str = str(month)
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.write(f"**{month_str} - Top Winners**")
-                    top_winners = month_data.nlargest(5, 'return_pct')[['stock', 'return_pct']]
-                    if not top_winners.empty:
-                        st.dataframe(top_winners, use_container_width=True)
-                    else:
-                        st.info("No winning trades this month")
-                
-                with col2:
-                    st.write(f"**{month_str} - Top Losers**")
-                    top_losers = month_data.nsmallest(5, 'return_pct')[['stock', 'return_pct']]
-                    if not top_losers.empty:
-                        st.dataframe(top_losers, use_container_width=True)
-                    else:
-                        st.info("No losing trades this month")
+            with col2:
+                st.write("**Top Losers by Month**")
+                st.dataframe(losers, use_container_width=True, hide_index=True)
             
             # Detailed Trade Log
             st.subheader("📊 Detailed Trade Log")
@@ -1618,8 +1584,10 @@ def admin_strategy_details_page():
             
             # Prepare trade log data (hide position sizes)
             trade_log = filtered_trades[['stock', 'buy_date', 'sell_date', 'buy_price', 'sell_price', 'return_pct', 'win_loss']].copy()
-            trade_log['buy_date'] = trade_log['buy_date'].dt.strftime('%Y-%m-%d')
-            trade_log['sell_date'] = trade_log['sell_date'].dt.strftime('%Y-%m-%d')
+            # NumPy's C-level ISO formatter is far faster than the
+            # per-element strftime loop for plain YYYY-MM-DD output
+            trade_log['buy_date'] = trade_log['buy_date'].to_numpy('datetime64[D]').astype(str)
+            trade_log['sell_date'] = trade_log['sell_date'].to_numpy('datetime64[D]').astype(str)
             trade_log['return_pct'] = trade_log['return_pct'].round(2)
             
             # Rename columns for better display
@@ -1629,7 +1597,16 @@ def admin_strategy_details_page():
         else:
             st.info("No trades with quantity >= 2 found.")
     else:
-        st.info("No trading data available yet. Please upload trade logs first.")
+        st.info(empty_msg)
+
+def admin_strategy_details_page():
+    """Admin page for detailed strategy information"""
+    require_auth("admin")
+    
+    st.title("📋 Strategy Details")
+    st.markdown("Detailed view of stock trading performance and individual trades.")
+    
+    _render_strategy_details("No trading data available yet. Please upload trade logs first.")
 
 def client_strategy_details_page():
     """Client page for detailed strategy information"""
@@ -1638,71 +1615,25 @@ def client_strategy_details_page():
     st.title("📋 Strategy Details")
     st.markdown("Detailed view of stock trading performance and individual trades.")
     
-    data_manager = st.session_state.data_manager
-    
-    if not data_manager.trades_df.empty:
-        # Filter trades with quantity >= 2
-        filtered_trades = data_manager.trades_df[data_manager.trades_df['quantity'] >= 2].copy()
-        
-        if not filtered_trades.empty:
-            # Top Winners and Losers by Month
-            st.subheader("🏆 Top Winners and Losers by Month")
-            
-            # Group by month and stock to calculate returns
-            filtered_trades['month'] = filtered_trades['sell_date'].dt.to_period('M')
-            monthly_stock_returns = filtered_trades.groupby(['month', 'stock']).agg({
-                'buy_price': 'first',
-                'sell_price': 'last',
-                'quantity': 'sum',
-                'profit_loss': 'sum'
-            }).reset_index()
-            
-            # Calculate return percentage
-            monthly_stock_returns['return_pct'] = ((monthly_stock_returns['sell_price'] - monthly_stock_returns['buy_price']) / monthly_stock_returns['buy_price'] * 100).round(2)
-            
-            # Get unique months
-            months = sorted(monthly_stock_returns['month'].unique())
-            
-            for month in months:
-                month_data = monthly_stock_returns[monthly_stock_returns['month'] == month]
-                month_str = str(month)
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.write(f"**{month_str} - Top Winners**")
-                    top_winners = month_data.nlargest(5, 'return_pct')[['stock', 'return_pct']]
-                    if not top_winners.empty:
-                        st.dataframe(top_winners, use_container_width=True)
-                    else:
-                        st.info("No winning trades this month")
-                
-                with col2:
-                    st.write(f"**{month_str} - Top Losers**")
-                    top_losers = month_data.nsmallest(5, 'return_pct')[['stock', 'return_pct']]
-                    if not top_losers.empty:
-                        st.dataframe(top_losers, use_container_width=True)
-                    else:
-                        st.info("No losing trades this month")
-            
-            # Detailed Trade Log
-            st.subheader("📊 Detailed Trade Log")
-            st.markdown("All trades with entry/exit prices and dates (quantity >= 2)")
-            
-            # Prepare trade log data (hide position sizes)
-            trade_log = filtered_trades[['stock', 'buy_date', 'sell_date', 'buy_price', 'sell_price', 'return_pct', 'win_loss']].copy()
-            trade_log['buy_date'] = trade_log['buy_date'].dt.strftime('%Y-%m-%d')
-            trade_log['sell_date'] = trade_log['sell_date'].dt.strftime('%Y-%m-%d')
-            trade_log['return_pct'] = trade_log['return_pct'].round(2)
-            
-            # Rename columns for better display
-            trade_log.columns = ['Symbol', 'Entry Date', 'Exit Date', 'Entry Price', 'Exit Price', 'Return %', 'Result']
-            
-            st.dataframe(trade_log, use_container_width=True)
-        else:
-            st.info("No trades with quantity >= 2 found.")
-    else:
-        st.info("No trading data available yet. Please ask the administrator to upload trade logs.")
+    _render_strategy_details("No trading data available yet. Please ask the administrator to upload trade logs.")
+
+# Navigation tables, built once at import time instead of per rerun
+_ADMIN_PAGES = {
+    "🏠 Dashboard Overview": admin_dashboard_page,
+    "📊 Upload Trade Log": admin_upload_trades_page,
+    "👥 Manage Clients": admin_manage_clients_page,
+    "💰 Capital Movements": admin_capital_movements_page,
+    "🏦 Capital Accounts": admin_capital_accounts_page,
+    "⚙️ Configuration": admin_configuration_page,
+    "📈 Strategy Analysis": admin_strategy_analysis_page,
+    "📋 Strategy Details": admin_strategy_details_page
+}
+
+_CLIENT_PAGES = {
+    "🏠 Capital Account": client_capital_account_page,
+    "📊 Strategy Summary": client_strategy_summary_page,
+    "📋 Strategy Details": client_strategy_details_page
+}
 
 if __name__ == "__main__":
     main()
@@ -1,18 +1,35 @@
 import streamlit as st
 import hashlib
+import hmac
 import json
 import os
+import atexit
+import secrets
+import threading
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
 import pandas as pd
 
 class AuthManager:
     def __init__(self):
+        # Guards users/sessions mutations now that one manager instance is
+        # shared across sessions via st.cache_resource
+        self._lock = threading.Lock()
+        self._sessions_dirty = False
+        self._last_sessions_flush = 0.0
+        # session_id -> user-info dict, so get_session_user doesn't rebuild
+        # the same dict on every script rerun (kept out of sessions.json)
+        self._user_info_cache = {}
+        # (session_id, required_role) -> bool; require_auth runs every rerun
+        self._role_cache = {}
         self.users_file = Path("data/users.json")
         self.sessions_file = Path("data/sessions.json")
         self._ensure_data_dir()
         self._load_users()
         self._load_sessions()
+        # Persist any batched session writes on clean shutdown
+        atexit.register(self._flush_sessions)
     
     def _ensure_data_dir(self):
         """Ensure data directory exists"""
@@ -52,72 +69,118 @@ class AuthManager:
             json.dump(self.users, f, indent=2)
     
     def _save_sessions(self):
-        """Save sessions to JSON file"""
+        """Persist sessions, debounced to one full-file rewrite per window
+        instead of one per login/cleanup"""
+        self._sessions_dirty = True
+        if time.monotonic() - self._last_sessions_flush > 5:
+            self._flush_sessions()
+    
+    def _flush_sessions(self):
+        """Write pending session changes to disk"""
+        if not self._sessions_dirty:
+            return
         with open(self.sessions_file, 'w') as f:
             json.dump(self.sessions, f, indent=2)
+        self._sessions_dirty = False
+        self._last_sessions_flush = time.monotonic()
+    
+    def _hash_password(self, password, salt=None):
+        """Hash password using salted scrypt, stored as 'salt$digest'"""
+        if salt is None:
+            salt = secrets.token_hex(16)
+        digest = hashlib.scrypt(password.encode(), salt=bytes.fromhex(salt),
+                                n=2**14, r=8, p=1).hex()
+        return f"{salt}${digest}"
     
-    def _hash_password(self, password):
-        """Hash password using SHA-256"""
-        return hashlib.sha256(password.encode()).hexdigest()
+    def _verify_password(self, password, stored_hash):
+        """Check a password against a stored hash.
+        
+        Supports the current salted scrypt format and the legacy unsalted
+        SHA-256 format so existing accounts keep working until rehashed.
+        """
+        if '$' in stored_hash:
+            salt, _ = stored_hash.split('$', 1)
+            return hmac.compare_digest(stored_hash, self._hash_password(password, salt))
+        return hmac.compare_digest(stored_hash, hashlib.sha256(password.encode()).hexdigest())
     
     def _cleanup_expired_sessions(self):
         """Remove expired sessions"""
-        current_time = datetime.now()
+        cutoff = time.time() - 24 * 3600
         expired_sessions = []
         
         for session_id, session_data in self.sessions.items():
-            session_time = datetime.fromisoformat(session_data['created_at'])
-            if current_time - session_time > timedelta(hours=24):
+            created = session_data['created_at']
+            if isinstance(created, str):
+                # Legacy ISO-format timestamp from an older sessions.json
+                created = datetime.fromisoformat(created).timestamp()
+            if created < cutoff:
                 expired_sessions.append(session_id)
         
         for session_id in expired_sessions:
             del self.sessions[session_id]
+            self._user_info_cache.pop(session_id, None)
+        if expired_sessions:
+            expired = set(expired_sessions)
+            self._role_cache = {k: v for k, v in self._role_cache.items() if k[0] not in expired}
         
         if expired_sessions:
             self._save_sessions()
     
     def login(self, username, password):
         """Authenticate user login"""
-        self._cleanup_expired_sessions()
-        
         if username in self.users and self.users[username]['active']:
-            if self.users[username]['password_hash'] == self._hash_password(password):
-                # Create session
-                session_id = self._generate_session_id()
-                self.sessions[session_id] = {
-                    'username': username,
-                    'role': self.users[username]['role'],
-                    'created_at': datetime.now().isoformat()
-                }
-                self._save_sessions()
+            if self._verify_password(password, self.users[username]['password_hash']):
+                with self._lock:
+                    self._cleanup_expired_sessions()
+                    # Transparently upgrade legacy SHA-256 hashes on login
+                    if '$' not in self.users[username]['password_hash']:
+                        self.users[username]['password_hash'] = self._hash_password(password)
+                        self._save_users()
+                    # Create session
+                    session_id = self._generate_session_id()
+                    self.sessions[session_id] = {
+                        'username': username,
+                        'role': self.users[username]['role'],
+                        # Epoch float: expiry checks become one subtraction
+                        # instead of a fromisoformat parse per session
+                        'created_at': time.time()
+                    }
+                    self._save_sessions()
                 return session_id, self.users[username]['role']
         
         return None, None
     
     def _generate_session_id(self):
         """Generate unique session ID"""
-        import secrets
         return secrets.token_urlsafe(32)
     
     def get_session_user(self, session_id):
         """Get user info from session"""
+        cached = self._user_info_cache.get(session_id)
+        if cached is not None and cached['username'] in self.users:
+            return cached
         if session_id in self.sessions:
             session_data = self.sessions[session_id]
             username = session_data['username']
             if username in self.users:
-                return {
+                user_info = {
                     'username': username,
                     'role': session_data['role'],
                     'name': self.users[username]['name'],
                     'email': self.users[username]['email']
                 }
+                self._user_info_cache[session_id] = user_info
+                return user_info
         return None
     
     def logout(self, session_id):
         """Logout user by removing session"""
-        if session_id in self.sessions:
-            del self.sessions[session_id]
-            self._save_sessions()
+        with self._lock:
+            if session_id in self.sessions:
+                del self.sessions[session_id]
+                self._user_info_cache.pop(session_id, None)
+                self._role_cache = {k: v for k, v in self._role_cache.items() if k[0] != session_id}
+                self._save_sessions()
     
     def is_authenticated(self, session_id):
         """Check if session is valid"""
@@ -125,17 +188,27 @@ class AuthManager:
     
     def has_role(self, session_id, required_role):
         """Check if user has required role"""
+        key = (session_id, required_role)
+        cached = self._role_cache.get(key)
+        if cached is not None:
+            return cached
+        result = False
         if session_id in self.sessions:
             user_role = self.sessions[session_id]['role']
             if required_role == 'admin':
-                return user_role == 'admin'
+                result = user_role == 'admin'
             elif required_role == 'client':
-                return user_role in ['admin', 'client']
-        return False
+                result = user_role in ['admin', 'client']
+            # Only cache live sessions so a later login isn't masked by a
+            # stale negative entry
+            self._role_cache[key] = result
+        return result
     
     def create_client(self, username, password, name, email, starting_capital, investment_start_date=None):
         """Create new client account (admin only)"""
-        if username not in self.users:
+        with self._lock:
+            if username in self.users:
+                return False
             if investment_start_date is None:
                 investment_start_date = datetime.now().date()
             
@@ -152,24 +225,42 @@ class AuthManager:
             }
             self._save_users()
             return True
-        return False
+    
+    def _invalidate_user_info(self, username):
+        """Drop cached user-info dicts for a user's sessions"""
+        stale = [sid for sid, info in self._user_info_cache.items()
+                 if info['username'] == username]
+        for sid in stale:
+            del self._user_info_cache[sid]
     
     def update_user(self, username, **kwargs):
         """Update user information (admin only)"""
-        if username in self.users:
-            for key, value in kwargs.items():
-                if key in ['name', 'email', 'active', 'starting_capital']:
-                    self.users[username][key] = value
-            self._save_users()
-            return True
+        with self._lock:
+            if username in self.users:
+                for key, value in kwargs.items():
+                    if key in ['name', 'email', 'active', 'starting_capital']:
+                        self.users[username][key] = value
+                self._invalidate_user_info(username)
+                self._save_users()
+                return True
         return False
     
     def delete_user(self, username):
         """Delete user account (admin only)"""
-        if username in self.users and username != 'admin':
-            del self.users[username]
-            self._save_users()
-            return True
+        with self._lock:
+            if username in self.users and username != 'admin':
+                del self.users[username]
+                # Drop cached profiles and role answers for the user's
+                # live sessions so they stop resolving after deletion
+                self._invalidate_user_info(username)
+                stale = [sid for sid, data in self.sessions.items()
+                         if data['username'] == username]
+                if stale:
+                    stale_set = set(stale)
+                    self._role_cache = {k: v for k, v in self._role_cache.items()
+                                        if k[0] not in stale_set}
+                self._save_users()
+                return True
         return False
     
     def get_all_users(self):
@@ -178,20 +269,26 @@ class AuthManager:
     
     def change_password(self, username, new_password):
         """Change user password"""
-        if username in self.users:
-            self.users[username]['password_hash'] = self._hash_password(new_password)
-            self._save_users()
-            return True
+        with self._lock:
+            if username in self.users:
+                self.users[username]['password_hash'] = self._hash_password(new_password)
+                self._save_users()
+                return True
         return False
     
     def load_users(self):
         """Load users data (public method)"""
         return self.users.copy()
 
+@st.cache_resource
+def _get_auth_manager():
+    """Shared AuthManager for all sessions in this process."""
+    return AuthManager()
+
 def init_auth():
     """Initialize authentication in Streamlit session state"""
     if 'auth_manager' not in st.session_state:
-        st.session_state.auth_manager = AuthManager()
+        st.session_state.auth_manager = _get_auth_manager()
     
     if 'session_id' not in st.session_state:
         st.session_state.session_id = None
@@ -1,19 +1,101 @@
+import functools
+import json
 import pandas as pd
 import numpy as np
+import queue
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime, timedelta
 import streamlit as st
 
+
+@functools.lru_cache(maxsize=8)
+def _read_config_cached(path, mtime):
+    """Parse a config JSON file, memoized on (path, mtime).
+
+    Writers always go through _save_config, which bumps the mtime, so a
+    hit here means the file is byte-identical to what was parsed before.
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
+# Canonical names for accepted upload headers, keyed by their normalized
+# (lowercase alphanumeric) form
+_UPLOAD_HEADER_MAP = {
+    'buydate': 'buy_date',
+    'selldate': 'sell_date',
+    'stock': 'stock',
+    'buyprice': 'buy_price',
+    'sellprice': 'sell_price',
+    'quantity': 'quantity',
+}
+
+
+def _normalize_header(name):
+    """Lowercase a header and strip everything non-alphanumeric."""
+    return ''.join(ch for ch in name.lower() if ch.isalnum())
+
+
 class TradingDataManager:
     def __init__(self):
         self.data_dir = Path("data")
         self.data_dir.mkdir(exist_ok=True)
-        
-        # File paths
-        self.trades_file = self.data_dir / "trades.csv"
+
+        # The manager is shared across sessions (st.cache_resource), so
+        # serialize refreshes and track when the last one actually ran
+        self._refresh_lock = threading.Lock()
+        self._last_refresh = 0.0
+        # Last-seen mtimes let refresh_data skip parsing unchanged files
+        self._mtimes = {}
+
+        # Monotonic counter bumped by every _save_* call; the app passes
+        # it as the cache key for memoized per-page computations, so any
+        # data mutation invalidates them on the next rerun
+        self._data_version = 0
+
+        # Per-period capital memo: get_monthly_capital/get_biweekly_capital
+        # are called once per period from the returns methods and each call
+        # scans monthly_capital_df plus the movements frame. Cleared
+        # whenever the underlying frames change.
+        self._monthly_capital_cache = {}
+        self._biweekly_capital_cache = {}
+
+        # Per-client strategy-returns memo: (kind, client_id) -> (version,
+        # frame). The stored version is checked against _data_version, so
+        # stale entries are recomputed after any save without an explicit
+        # clear in every mutator.
+        self._strategy_returns_cache = {}
+
+        # users.json parse cache for sync_clients_from_users, keyed on mtime
+        self._users_mtime = None
+        self._users_cache = None
+
+        # Deferred-save batching: inside batch_saves(), the _save_* methods
+        # mark their file dirty instead of rewriting it, and leaving the
+        # outermost batch flushes each dirty file once. Multi-mutation
+        # admin flows go from one full-file rewrite per change to one total.
+        self._batch_depth = 0
+        self._dirty_files = set()
+
+        # Write-behind saves: event handlers enqueue a save and return
+        # immediately; a daemon thread flushes trades to disk
+        self._save_queue = queue.Queue()
+        self._save_worker = threading.Thread(target=self._drain_save_queue, daemon=True)
+        self._save_worker.start()
+        
+        # File paths. Trades, movements and monthly capital persist as
+        # Parquet: native dtypes load without re-parsing dates on every
+        # rerun. The .csv paths remain for one-shot migration of data
+        # written by older versions. Clients stays CSV (tiny, hand-edited).
+        self.trades_file = self.data_dir / "trades.parquet"
+        self.trades_csv_file = self.data_dir / "trades.csv"
         self.clients_file = self.data_dir / "clients.csv"
-        self.capital_movements_file = self.data_dir / "capital_movements.csv"
-        self.monthly_capital_file = self.data_dir / "monthly_capital.csv"
+        self.capital_movements_file = self.data_dir / "capital_movements.parquet"
+        self.capital_movements_csv_file = self.data_dir / "capital_movements.csv"
+        self.monthly_capital_file = self.data_dir / "monthly_capital.parquet"
+        self.monthly_capital_csv_file = self.data_dir / "monthly_capital.csv"
         self.config_file = self.data_dir / "config.json"
         
         # Initialize data structures
@@ -25,11 +107,12 @@ class TradingDataManager:
     
     def _load_config(self):
         """Load configuration settings"""
+        self._config_cache = {}
         if self.config_file.exists():
-            with open(self.config_file, 'r') as f:
-                import json
-                old_config = json.load(f)
-                
+            old_config = _read_config_cached(
+                str(self.config_file), self.config_file.stat().st_mtime
+            )
+            
             # Migrate old config format to new format
             if "global" not in old_config and "clients" not in old_config:
                 # This is the old format, migrate it
@@ -62,16 +145,44 @@ class TradingDataManager:
     
     def _save_config(self):
         """Save configuration settings"""
+        self._data_version += 1
+        # Any change invalidates the merged-config cache
+        self._config_cache = {}
+        if self._batch_depth:
+            self._dirty_files.add('config')
+            return
+        self._write_config()
+
+    def _write_config(self):
         with open(self.config_file, 'w') as f:
-            import json
             json.dump(self.config, f, indent=2)
     
     def _load_trades(self):
         """Load trades data"""
         if self.trades_file.exists():
-            self.trades_df = pd.read_csv(self.trades_file)
-            self.trades_df['buy_date'] = pd.to_datetime(self.trades_df['buy_date'])
-            self.trades_df['sell_date'] = pd.to_datetime(self.trades_df['sell_date'])
+            # Parquet preserves datetimes and categoricals, so no
+            # post-load conversions are needed
+            self.trades_df = pd.read_parquet(self.trades_file)
+        elif self.trades_csv_file.exists():
+            self.trades_df = pd.read_csv(self.trades_csv_file)
+            # Legacy CSVs may carry mixed date formats, so keep inference
+            # but let the parse cache collapse repeated date strings
+            self.trades_df['buy_date'] = pd.to_datetime(self.trades_df['buy_date'], cache=True)
+            self.trades_df['sell_date'] = pd.to_datetime(self.trades_df['sell_date'], cache=True)
+            # Categoricals: equality/isin filters compare int codes instead
+            # of per-row Python strings, and the columns shrink 5-10x
+            for col in ('stock', 'win_loss'):
+                if col in self.trades_df.columns:
+                    self.trades_df[col] = self.trades_df[col].astype('category')
+            # Keep return_pct as a persistent derived column so pages can
+            # filter on it without recomputing per rerun
+            if 'return_pct' not in self.trades_df.columns and not self.trades_df.empty:
+                self.trades_df['return_pct'] = (
+                    (self.trades_df['sell_price'].to_numpy() - self.trades_df['buy_price'].to_numpy())
+                    / self.trades_df['buy_price'].to_numpy() * 100.0
+                )
+            # One-shot CSV -> Parquet migration
+            self._save_trades()
         else:
             # Create sample trades structure
             self.trades_df = pd.DataFrame({
@@ -88,11 +199,42 @@ class TradingDataManager:
                 'win_loss': []
             })
             self._save_trades()
+        # Persistent int8 win flag: lets the period aggregations use the
+        # Cython 'sum' reducer instead of a Python lambda per group
+        if 'is_win' not in self.trades_df.columns and not self.trades_df.empty:
+            self.trades_df['is_win'] = (self.trades_df['win_loss'] == 'Win').astype('int8')
+        self._refresh_period_columns()
+    
+    @property
+    def data_version(self):
+        """Monotonic data-mutation counter, suitable as a cache key."""
+        return self._data_version
+
+    def _refresh_period_columns(self):
+        """Cache the sell-date period conversions as hidden columns.
+        
+        The grouped-returns methods all need sell_date bucketed by month,
+        biweek or day; doing the O(N) to_period conversion once here (and
+        again after uploads) means every rerun gets it for free. The
+        columns are stripped again in _save_trades.
+        """
+        if self.trades_df.empty:
+            return
+        sell_dates = self.trades_df['sell_date']
+        self.trades_df['_sell_month'] = sell_dates.dt.to_period('M')
+        self.trades_df['_sell_biweek'] = sell_dates.dt.to_period('2W')
+        self.trades_df['_sell_day'] = sell_dates.dt.to_period('D')
     
     def _load_clients(self):
         """Load clients data"""
         if self.clients_file.exists():
             self.clients_df = pd.read_csv(self.clients_file)
+            # Parse the date column once here so per-row consumers never
+            # need scalar pd.to_datetime calls
+            if 'investment_start_date' in self.clients_df.columns:
+                self.clients_df['investment_start_date'] = pd.to_datetime(
+                    self.clients_df['investment_start_date'], errors='coerce', cache=True
+                )
         else:
             # Create sample clients structure
             self.clients_df = pd.DataFrame({
@@ -106,69 +248,203 @@ class TradingDataManager:
             self._save_clients()
         # After loading, merge-in any clients from users.json so UI shows all
         self.sync_clients_from_users()
+        # Materialize the id list and per-client dicts once; lookups by
+        # client_id become O(1) instead of a boolean-mask scan per call
+        self.client_ids = self.clients_df['client_id'].tolist()
+        self._clients_by_id = self.clients_df.set_index('client_id').to_dict(orient='index')
     
     def _load_capital_movements(self):
         """Load capital movements data"""
         if self.capital_movements_file.exists():
-            self.capital_movements_df = pd.read_csv(self.capital_movements_file)
-            self.capital_movements_df['date'] = pd.to_datetime(self.capital_movements_df['date'])
+            self.capital_movements_df = pd.read_parquet(self.capital_movements_file)
+        elif self.capital_movements_csv_file.exists():
+            self.capital_movements_df = pd.read_csv(self.capital_movements_csv_file)
+            # Dates were written by to_csv from a datetime column, so the
+            # format is known ISO; skipping inference avoids the per-row
+            # format guess and the cache dedups repeated same-day strings
+            self.capital_movements_df['date'] = pd.to_datetime(
+                self.capital_movements_df['date'], format='%Y-%m-%d', cache=True
+            )
+            for col in ('client_id', 'type'):
+                if col in self.capital_movements_df.columns:
+                    self.capital_movements_df[col] = self.capital_movements_df[col].astype('category')
+            # One-shot CSV -> Parquet migration
+            self._save_capital_movements()
         else:
-            # Create sample capital movements structure
+            # Create sample capital movements structure, with real dtypes
+            # so the empty frame survives a Parquet round trip
             self.capital_movements_df = pd.DataFrame({
-                'movement_id': [],
-                'client_id': [],
-                'date': [],
-                'type': [],  # 'contribution' or 'withdrawal'
-                'amount': [],
-                'notes': []
+                'movement_id': pd.Series([], dtype='object'),
+                'client_id': pd.Series([], dtype='object'),
+                'date': pd.Series([], dtype='datetime64[ns]'),
+                'type': pd.Series([], dtype='object'),  # 'contribution' or 'withdrawal'
+                'amount': pd.Series([], dtype='float64'),
+                'notes': pd.Series([], dtype='object')
             })
             self._save_capital_movements()
-    
+        self._index_capital_movements()
+
+    def _index_capital_movements(self):
+        """Cache NumPy views of the movements frame for the capital getters.
+
+        get_monthly_capital/get_biweekly_capital sum movements up to a
+        period on their default path; comparing cached int64 period
+        ordinals against a scalar avoids re-running the O(N) Period
+        conversion on every cold lookup.
+        """
+        if self.capital_movements_df.empty:
+            self._mov_month_ord = np.empty(0, dtype='int64')
+            self._mov_2w_ord = np.empty(0, dtype='int64')
+            self._mov_contrib_prefix = np.empty(0)
+            self._mov_withdraw_prefix = np.empty(0)
+            self._mov_by_client = {}
+            return
+        dates = self.capital_movements_df['date']
+        types = self.capital_movements_df['type']
+        amounts = self.capital_movements_df['amount'].to_numpy(dtype='float64')
+        contrib = np.where((types == 'contribution').to_numpy(), amounts, 0.0)
+        withdraw = np.where((types == 'withdrawal').to_numpy(), amounts, 0.0)
+        # Sorted by date with prefix sums, an "up to period" query becomes
+        # one searchsorted plus one array read
+        order = np.argsort(dates.to_numpy(), kind='stable')
+        self._mov_month_ord = dates.dt.to_period('M').astype('int64').to_numpy()[order]
+        self._mov_2w_ord = dates.dt.to_period('2W').astype('int64').to_numpy()[order]
+        self._mov_contrib_prefix = np.cumsum(contrib[order])
+        self._mov_withdraw_prefix = np.cumsum(withdraw[order])
+        # Pre-split movements per client; get_client_capital_flow then
+        # starts from an O(1) dict hit instead of an O(N) mask scan
+        self._mov_by_client = {
+            cid: sub for cid, sub in
+            self.capital_movements_df.groupby('client_id', observed=True, sort=False)
+        }
+
     def _save_trades(self):
         """Save trades data"""
-        self.trades_df.to_csv(self.trades_file, index=False)
-    
+        self._data_version += 1
+        if self._batch_depth:
+            self._dirty_files.add('trades')
+            return
+        self._write_trades()
+
+    def _write_trades(self):
+        persisted = [c for c in self.trades_df.columns if not c.startswith('_sell')]
+        self.trades_df[persisted].to_parquet(self.trades_file, index=False)
+
+    def _queue_save(self):
+        """Request an asynchronous trades save instead of blocking the caller"""
+        self._save_queue.put(True)
+
+    def _drain_save_queue(self):
+        """Daemon loop: flush queued trade saves, collapsing duplicates"""
+        while True:
+            self._save_queue.get()
+            # Collapse any saves that accumulated while we slept
+            while True:
+                try:
+                    self._save_queue.get_nowait()
+                except queue.Empty:
+                    break
+            try:
+                self._save_trades()
+            except Exception as e:
+                print(f"Error saving trades: {str(e)}")
+
+    def flush(self):
+        """Write any saves deferred by batch_saves() to disk"""
+        pending, self._dirty_files = self._dirty_files, set()
+        writers = {
+            'config': self._write_config,
+            'clients': self._write_clients,
+            'trades': self._write_trades,
+            'movements': self._write_capital_movements,
+            'monthly_capital': self._write_monthly_capital,
+        }
+        for name in pending:
+            writers[name]()
+
+    @contextmanager
+    def batch_saves(self):
+        """Coalesce disk writes across a multi-mutation flow.
+
+        In-memory state, version bumps and cache invalidation still happen
+        per mutation; only the full-file rewrites are deferred to a single
+        flush when the outermost batch exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
     def _save_clients(self):
         """Save clients data"""
+        self._data_version += 1
+        self.client_ids = self.clients_df['client_id'].tolist()
+        self._clients_by_id = self.clients_df.set_index('client_id').to_dict(orient='index')
+        # Starting capital feeds the default in the per-period capital memo
+        self._monthly_capital_cache.clear()
+        self._biweekly_capital_cache.clear()
+        if self._batch_depth:
+            self._dirty_files.add('clients')
+            return
+        self._write_clients()
+
+    def _write_clients(self):
         self.clients_df.to_csv(self.clients_file, index=False)
     
     def _save_capital_movements(self):
         """Save capital movements data"""
-        self.capital_movements_df.to_csv(self.capital_movements_file, index=False)
+        self._data_version += 1
+        self._index_capital_movements()
+        self._monthly_capital_cache.clear()
+        self._biweekly_capital_cache.clear()
+        if self._batch_depth:
+            self._dirty_files.add('movements')
+            return
+        self._write_capital_movements()
+
+    def _write_capital_movements(self):
+        self.capital_movements_df.to_parquet(self.capital_movements_file, index=False)
     
+    @staticmethod
+    def _trade_signatures(frame):
+        """Per-row uint64 signature over the duplicate-detection key fields.
+
+        Prices and quantity are widened to float64 and prices rounded so
+        dtype differences between stored and freshly-parsed frames can't
+        mask duplicates.
+        """
+        keys = pd.DataFrame({
+            'buy_date': frame['buy_date'],
+            'sell_date': frame['sell_date'],
+            'stock': frame['stock'].astype(str),
+            'buy_price': frame['buy_price'].astype('float64').round(4),
+            'sell_price': frame['sell_price'].astype('float64').round(4),
+            'quantity': frame['quantity'].astype('float64'),
+        })
+        return pd.util.hash_pandas_object(keys, index=False)
+
     def upload_trades(self, file):
         """Upload and process trade log"""
         try:
             if file.name.endswith('.csv'):
-                df = pd.read_csv(file)
+                # Stream the upload in chunks so large files never hold the
+                # full 2-3x parse buffer in memory at once
+                reader = pd.read_csv(file, chunksize=100_000)
+                df = pd.concat(list(reader), ignore_index=True)
             elif file.name.endswith(('.xlsx', '.xls')):
                 df = pd.read_excel(file)
             else:
                 return False, "Unsupported file format"
             
             # Normalize headers to accept variants like "Buy Date", "Sell Price", etc.
-            def _normalize(name):
-                return ''.join(ch for ch in name.lower() if ch.isalnum())
-
-            header_map = {}
-            for c in df.columns:
-                key = _normalize(c)
-                if key in {
-                    'buydate', 'selldate', 'stock', 'buyprice', 'sellprice', 'quantity'
-                }:
-                    if key == 'buydate':
-                        header_map[c] = 'buy_date'
-                    elif key == 'selldate':
-                        header_map[c] = 'sell_date'
-                    elif key == 'stock':
-                        header_map[c] = 'stock'
-                    elif key == 'buyprice':
-                        header_map[c] = 'buy_price'
-                    elif key == 'sellprice':
-                        header_map[c] = 'sell_price'
-                    elif key == 'quantity':
-                        header_map[c] = 'quantity'
-
+            header_map = {
+                c: _UPLOAD_HEADER_MAP[key]
+                for c in df.columns
+                if (key := _normalize_header(c)) in _UPLOAD_HEADER_MAP
+            }
             if header_map:
                 df = df.rename(columns=header_map)
 
@@ -179,14 +455,33 @@ class TradingDataManager:
                 return False, f"Missing required columns: {missing_columns}. Accepted headers include: Buy Date, Sell Date, Stock, Buy Price, Sell Price, Quantity"
             
             # Process trades
-            df['buy_date'] = pd.to_datetime(df['buy_date'])
-            df['sell_date'] = pd.to_datetime(df['sell_date'])
+            # Uploaded CSVs use whatever format the broker exports, so keep
+            # inference; cache=True dedups the (typically few) distinct dates
+            df['buy_date'] = pd.to_datetime(df['buy_date'], cache=True)
+            df['sell_date'] = pd.to_datetime(df['sell_date'], cache=True)
+
+            # Compact dtypes: float32 prices halve memory, category tickers
+            # turn string compares into int code compares
+            df['buy_price'] = df['buy_price'].astype('float32')
+            df['sell_price'] = df['sell_price'].astype('float32')
+            df['quantity'] = pd.to_numeric(df['quantity'], downcast='integer')
+            df['stock'] = df['stock'].astype('category')
             
-            # Calculate derived fields
-            df['profit_loss'] = (df['sell_price'] - df['buy_price']) * df['quantity']
-            df['position_size'] = df['buy_price'] * df['quantity']
-            df['return_pct'] = (df['sell_price'] - df['buy_price']) / df['buy_price'] * 100
-            df['win_loss'] = df['profit_loss'].apply(lambda x: 'Win' if x > 0 else 'Loss')
+            # Calculate derived fields on the raw NumPy arrays; the price
+            # diff is computed once and shared across profit_loss and
+            # return_pct instead of pandas rebuilding it per expression
+            buy = df['buy_price'].to_numpy()
+            sell = df['sell_price'].to_numpy()
+            qty = df['quantity'].to_numpy()
+            diff = sell - buy
+            df['profit_loss'] = diff * qty
+            df['position_size'] = buy * qty
+            df['return_pct'] = diff / buy * 100
+            wins = df['profit_loss'].to_numpy() > 0
+            df['win_loss'] = pd.Categorical(
+                np.where(wins, 'Win', 'Loss'), categories=['Win', 'Loss']
+            )
+            df['is_win'] = wins.astype('int8')
             
             # Add trade ID if not present
             if 'trade_id' not in df.columns:
@@ -199,48 +494,34 @@ class TradingDataManager:
                 if day_trades_count > 0:
                     st.info(f"Removed {day_trades_count} day trades")
             
-            # Handle duplicates - remove duplicates based on key fields
-            # Create a unique identifier for each trade
-            df['trade_signature'] = (
-                df['buy_date'].astype(str) + '_' + 
-                df['sell_date'].astype(str) + '_' + 
-                df['stock'].astype(str) + '_' + 
-                df['buy_price'].astype(str) + '_' + 
-                df['sell_price'].astype(str) + '_' + 
-                df['quantity'].astype(str)
-            )
+            # Handle duplicates via per-row uint64 hashes over the key
+            # columns — computed in C, no intermediate string columns
+            new_sigs = self._trade_signatures(df)
             
             # If there are existing trades, remove duplicates
             if not self.trades_df.empty:
-                # Create trade signature for existing trades
-                existing_trades = self.trades_df.copy()
-                existing_trades['trade_signature'] = (
-                    existing_trades['buy_date'].astype(str) + '_' + 
-                    existing_trades['sell_date'].astype(str) + '_' + 
-                    existing_trades['stock'].astype(str) + '_' + 
-                    existing_trades['buy_price'].astype(str) + '_' + 
-                    existing_trades['sell_price'].astype(str) + '_' + 
-                    existing_trades['quantity'].astype(str)
-                )
+                existing_sigs = self._trade_signatures(self.trades_df)
                 
                 # Find duplicates in the new data
-                duplicates_in_new = df['trade_signature'].isin(existing_trades['trade_signature'])
-                duplicate_count = duplicates_in_new.sum()
+                duplicates_in_new = new_sigs.isin(existing_sigs.to_numpy()).to_numpy()
+                duplicate_count = int(duplicates_in_new.sum())
                 
                 if duplicate_count > 0:
                     st.warning(f"Found {duplicate_count} duplicate trades. Removing duplicates...")
                     df = df[~duplicates_in_new]
+                    new_sigs = new_sigs[~duplicates_in_new]
                 
                 # Remove duplicates within the new data itself
-                df = df.drop_duplicates(subset=['trade_signature'], keep='first')
+                df = df[~new_sigs.duplicated().to_numpy()]
                 
                 # Combine with existing trades
-                self.trades_df = pd.concat([existing_trades.drop('trade_signature', axis=1), df.drop('trade_signature', axis=1)], ignore_index=True)
+                self.trades_df = pd.concat([self.trades_df, df], ignore_index=True)
             else:
                 # No existing trades, just remove internal duplicates
-                df = df.drop_duplicates(subset=['trade_signature'], keep='first')
-                self.trades_df = df.drop('trade_signature', axis=1)
+                df = df[~new_sigs.duplicated().to_numpy()]
+                self.trades_df = df
             
+            self._refresh_period_columns()
             self._save_trades()
             
             return True, f"Successfully uploaded {len(df)} trades (duplicates removed)"
@@ -250,17 +531,24 @@ class TradingDataManager:
     
     def get_monthly_strategy_returns(self, client_id=None):
         """Calculate monthly strategy returns based on client capital, not position size"""
+        cache_key = ('monthly', client_id)
+        cached = self._strategy_returns_cache.get(cache_key)
+        if cached is not None and cached[0] == self._data_version:
+            return cached[1]
         if self.trades_df.empty:
             return pd.DataFrame()
         
-        # Filter trades by client investment start date if client_id is provided
-        trades_df = self.trades_df.copy()
+        # Filter trades by client investment start date if client_id is
+        # provided. Shallow copy: downstream only adds new columns onto the
+        # local frame, so no O(N) deep copy is needed
+        trades_df = self.trades_df.copy(deep=False)
         
         if client_id:
-            # Get client investment start date
-            client_info = self.clients_df[self.clients_df['client_id'] == client_id]
-            if not client_info.empty and 'investment_start_date' in client_info.columns:
-                investment_start_date = client_info['investment_start_date'].iloc[0]
+            # Get client investment start date via the per-client dict
+            # built at load time — no boolean-mask scan of clients_df
+            client_info = self._clients_by_id.get(client_id)
+            if client_info is not None and 'investment_start_date' in client_info:
+                investment_start_date = client_info['investment_start_date']
                 if not pd.isna(investment_start_date):
                     # Convert to datetime if needed
                     if hasattr(investment_start_date, 'strftime'):
@@ -273,64 +561,71 @@ class TradingDataManager:
         if trades_df.empty:
             return pd.DataFrame()
         
-        # Group by month
-        trades_df['month'] = trades_df['sell_date'].dt.to_period('M')
+        # Group by month (bucketed once at load time); is_win is the
+        # persistent int8 flag, so 'sum' counts wins on the Cython path
+        trades_df['month'] = trades_df['_sell_month']
         
         monthly_stats = trades_df.groupby('month').agg({
             'profit_loss': 'sum',
             'trade_id': 'count',
-            'win_loss': lambda x: (x == 'Win').sum()
+            'is_win': 'sum'
         }).reset_index()
         
         monthly_stats.columns = ['Month', 'Total_PL', 'Total_Trades', 'Winning_Trades']
         monthly_stats['Month'] = monthly_stats['Month'].astype(str)
-        monthly_stats['Win_Rate'] = (monthly_stats['Winning_Trades'] / monthly_stats['Total_Trades'] * 100).round(2)
         
-        # Calculate return percentage based on client capital for each month
+        # Capital per month, then win rate and capital-relative return in
+        # one NumPy pass over the aggregated arrays (NaN/inf -> 0)
         monthly_stats['Client_Capital'] = monthly_stats['Month'].apply(lambda x: self.get_monthly_capital(x))
-        monthly_stats['Return_Pct'] = (monthly_stats['Total_PL'] / monthly_stats['Client_Capital'] * 100).round(2)
-        # Replace any infinite or NaN values with 0
-        monthly_stats['Return_Pct'] = monthly_stats['Return_Pct'].fillna(0).replace([float('inf'), float('-inf')], 0)
-        
-        # Calculate average win percentage for winning trades
-        def get_avg_win_pct(month_period):
-            month_trades = self.trades_df[self.trades_df['sell_date'].dt.to_period('M') == month_period]
-            winning_trades = month_trades[month_trades['win_loss'] == 'Win']
-            if not winning_trades.empty:
-                win_pcts = ((winning_trades['sell_price'] - winning_trades['buy_price']) / winning_trades['buy_price'] * 100)
-                return win_pcts.mean()
-            return 0
-        
-        # Calculate average loss percentage for losing trades
-        def get_avg_loss_pct(month_period):
-            month_trades = self.trades_df[self.trades_df['sell_date'].dt.to_period('M') == month_period]
-            losing_trades = month_trades[month_trades['win_loss'] == 'Loss']
-            if not losing_trades.empty:
-                loss_pcts = ((losing_trades['sell_price'] - losing_trades['buy_price']) / losing_trades['buy_price'] * 100)
-                return loss_pcts.mean()
-            return 0
-        
-        monthly_stats['Avg_Win_Pct'] = monthly_stats['Month'].apply(lambda x: round(get_avg_win_pct(pd.to_datetime(x).to_period('M')), 2))
-        monthly_stats['Avg_Loss_Pct'] = monthly_stats['Month'].apply(lambda x: round(get_avg_loss_pct(pd.to_datetime(x).to_period('M')), 2))
+        pl = monthly_stats['Total_PL'].to_numpy()
+        trades = monthly_stats['Total_Trades'].to_numpy()
+        wins = monthly_stats['Winning_Trades'].to_numpy()
+        cap = monthly_stats['Client_Capital'].to_numpy(dtype='float64')
+        with np.errstate(divide='ignore', invalid='ignore'):
+            monthly_stats['Win_Rate'] = np.round(wins / trades * 100, 2)
+            return_pct = np.nan_to_num(
+                np.round(pl / cap * 100, 2), nan=0.0, posinf=0.0, neginf=0.0
+            )
+        monthly_stats['Return_Pct'] = return_pct
+        
+        # Average win/loss percentages: one grouped pass over all trades
+        # (intentionally unfiltered, as before) instead of re-scanning the
+        # frame once per month. return_pct is precomputed at load time.
+        all_months = self.trades_df['_sell_month'].astype(str)
+        ret_pct = self.trades_df['return_pct']
+        win_mask = self.trades_df['win_loss'] == 'Win'
+        loss_mask = self.trades_df['win_loss'] == 'Loss'
+        avg_win_by_month = ret_pct[win_mask].groupby(all_months[win_mask]).mean()
+        avg_loss_by_month = ret_pct[loss_mask].groupby(all_months[loss_mask]).mean()
+        monthly_stats['Avg_Win_Pct'] = monthly_stats['Month'].map(avg_win_by_month).fillna(0).round(2)
+        monthly_stats['Avg_Loss_Pct'] = monthly_stats['Month'].map(avg_loss_by_month).fillna(0).round(2)
         
         # Calculate cumulative return as actual percentage addition
-        monthly_stats['Cumulative_Return'] = monthly_stats['Return_Pct'].cumsum()
+        monthly_stats['Cumulative_Return'] = np.cumsum(return_pct)
         
+        self._strategy_returns_cache[cache_key] = (self._data_version, monthly_stats)
         return monthly_stats
     
     def get_biweekly_strategy_returns(self, client_id=None):
         """Calculate biweekly strategy returns based on client capital, not position size"""
+        cache_key = ('biweekly', client_id)
+        cached = self._strategy_returns_cache.get(cache_key)
+        if cached is not None and cached[0] == self._data_version:
+            return cached[1]
         if self.trades_df.empty:
             return pd.DataFrame()
         
-        # Filter trades by client investment start date if client_id is provided
-        trades_df = self.trades_df.copy()
+        # Filter trades by client investment start date if client_id is
+        # provided. Shallow copy: downstream only adds new columns onto the
+        # local frame, so no O(N) deep copy is needed
+        trades_df = self.trades_df.copy(deep=False)
         
         if client_id:
-            # Get client investment start date
-            client_info = self.clients_df[self.clients_df['client_id'] == client_id]
-            if not client_info.empty and 'investment_start_date' in client_info.columns:
-                investment_start_date = client_info['investment_start_date'].iloc[0]
+            # Get client investment start date via the per-client dict
+            # built at load time — no boolean-mask scan of clients_df
+            client_info = self._clients_by_id.get(client_id)
+            if client_info is not None and 'investment_start_date' in client_info:
+                investment_start_date = client_info['investment_start_date']
                 if not pd.isna(investment_start_date):
                     # Convert to datetime if needed
                     if hasattr(investment_start_date, 'strftime'):
@@ -343,75 +638,52 @@ class TradingDataManager:
         if trades_df.empty:
             return pd.DataFrame()
         
-        # Group by biweekly periods (every 2 weeks)
-        trades_df['biweek'] = trades_df['sell_date'].dt.to_period('2W')
+        # Group by biweekly periods (bucketed once at load time)
+        trades_df['biweek'] = trades_df['_sell_biweek']
         
         biweekly_stats = trades_df.groupby('biweek').agg({
             'profit_loss': 'sum',
             'trade_id': 'count',
-            'win_loss': lambda x: (x == 'Win').sum()
+            'is_win': 'sum'
         }).reset_index()
         
         biweekly_stats.columns = ['Period', 'Total_PL', 'Total_Trades', 'Winning_Trades']
         
-        # Create better period labels (e.g., "Jun 1", "Jun 15" for biweekly periods)
-        def format_period_label(period_str):
-            try:
-                # Extract start date from period string
-                start_date_str = period_str.split('/')[0]
-                start_date = pd.to_datetime(start_date_str)
-                return start_date.strftime('%b %d')
-            except:
-                return period_str
-        
-        biweekly_stats['Period_Label'] = biweekly_stats['Period'].apply(format_period_label)
+        # Create better period labels (e.g., "Jun 1", "Jun 15") in one
+        # vectorized pass over the period column
+        biweekly_stats['Period_Label'] = biweekly_stats['Period'].dt.start_time.dt.strftime('%b %d')
         biweekly_stats['Period'] = biweekly_stats['Period'].astype(str)
-        biweekly_stats['Win_Rate'] = (biweekly_stats['Winning_Trades'] / biweekly_stats['Total_Trades'] * 100).round(2)
         
-        # Calculate return percentage based on client capital for each biweekly period
+        # Capital per period, then win rate and capital-relative return in
+        # one NumPy pass over the aggregated arrays (NaN/inf -> 0)
         biweekly_stats['Client_Capital'] = biweekly_stats['Period'].apply(lambda x: self.get_biweekly_capital(x))
-        biweekly_stats['Return_Pct'] = (biweekly_stats['Total_PL'] / biweekly_stats['Client_Capital'] * 100).round(2)
-        # Replace any infinite or NaN values with 0
-        biweekly_stats['Return_Pct'] = biweekly_stats['Return_Pct'].fillna(0).replace([float('inf'), float('-inf')], 0)
-        
-        # Calculate average win percentage for winning trades
-        def get_avg_win_pct_biweekly(period_str):
-            try:
-                start_date_str = period_str.split('/')[0]
-                period_dt = pd.to_datetime(start_date_str)
-                period_period = period_dt.to_period('2W')
-            except:
-                return 0
-            
-            period_trades = self.trades_df[self.trades_df['sell_date'].dt.to_period('2W') == period_period]
-            winning_trades = period_trades[period_trades['win_loss'] == 'Win']
-            if not winning_trades.empty:
-                win_pcts = ((winning_trades['sell_price'] - winning_trades['buy_price']) / winning_trades['buy_price'] * 100)
-                return win_pcts.mean()
-            return 0
-        
-        # Calculate average loss percentage for losing trades
-        def get_avg_loss_pct_biweekly(period_str):
-            try:
-                start_date_str = period_str.split('/')[0]
-                period_dt = pd.to_datetime(start_date_str)
-                period_period = period_dt.to_period('2W')
-            except:
-                return 0
-            
-            period_trades = self.trades_df[self.trades_df['sell_date'].dt.to_period('2W') == period_period]
-            losing_trades = period_trades[period_trades['win_loss'] == 'Loss']
-            if not losing_trades.empty:
-                loss_pcts = ((losing_trades['sell_price'] - losing_trades['buy_price']) / losing_trades['buy_price'] * 100)
-                return loss_pcts.mean()
-            return 0
-        
-        biweekly_stats['Avg_Win_Pct'] = biweekly_stats['Period'].apply(lambda x: round(get_avg_win_pct_biweekly(x), 2))
-        biweekly_stats['Avg_Loss_Pct'] = biweekly_stats['Period'].apply(lambda x: round(get_avg_loss_pct_biweekly(x), 2))
+        pl = biweekly_stats['Total_PL'].to_numpy()
+        trades = biweekly_stats['Total_Trades'].to_numpy()
+        wins = biweekly_stats['Winning_Trades'].to_numpy()
+        cap = biweekly_stats['Client_Capital'].to_numpy(dtype='float64')
+        with np.errstate(divide='ignore', invalid='ignore'):
+            biweekly_stats['Win_Rate'] = np.round(wins / trades * 100, 2)
+            return_pct = np.nan_to_num(
+                np.round(pl / cap * 100, 2), nan=0.0, posinf=0.0, neginf=0.0
+            )
+        biweekly_stats['Return_Pct'] = return_pct
+        
+        # Average win/loss percentages: one grouped pass over all trades
+        # (intentionally unfiltered, as before) instead of re-scanning the
+        # frame once per period
+        all_periods = self.trades_df['_sell_biweek'].astype(str)
+        ret_pct = self.trades_df['return_pct']
+        win_mask = self.trades_df['win_loss'] == 'Win'
+        loss_mask = self.trades_df['win_loss'] == 'Loss'
+        avg_win_by_period = ret_pct[win_mask].groupby(all_periods[win_mask]).mean()
+        avg_loss_by_period = ret_pct[loss_mask].groupby(all_periods[loss_mask]).mean()
+        biweekly_stats['Avg_Win_Pct'] = biweekly_stats['Period'].map(avg_win_by_period).fillna(0).round(2)
+        biweekly_stats['Avg_Loss_Pct'] = biweekly_stats['Period'].map(avg_loss_by_period).fillna(0).round(2)
         
         # Calculate cumulative return as actual percentage addition
-        biweekly_stats['Cumulative_Return'] = biweekly_stats['Return_Pct'].cumsum()
+        biweekly_stats['Cumulative_Return'] = np.cumsum(return_pct)
         
+        self._strategy_returns_cache[cache_key] = (self._data_version, biweekly_stats)
         return biweekly_stats
     
     def get_daily_strategy_returns(self):
@@ -419,37 +691,29 @@ class TradingDataManager:
         if self.trades_df.empty:
             return pd.DataFrame()
         
-        # Group by daily periods
-        self.trades_df['day'] = self.trades_df['sell_date'].dt.to_period('D')
-        
-        daily_stats = self.trades_df.groupby('day').agg({
+        # Group by daily periods (bucketed once at load time)
+        daily_stats = self.trades_df.groupby('_sell_day').agg({
             'profit_loss': 'sum',
             'position_size': 'sum',
             'trade_id': 'count',
-            'win_loss': lambda x: (x == 'Win').sum()
+            'is_win': 'sum'
         }).reset_index()
         
         daily_stats.columns = ['Period', 'Total_PL', 'Total_Position_Size', 'Total_Trades', 'Winning_Trades']
         
-        # Create better period labels (e.g., "Jun 1", "Jun 2" for daily periods)
-        def format_daily_label(period_str):
-            try:
-                # Extract start date from period string
-                start_date_str = period_str.split('/')[0]
-                start_date = pd.to_datetime(start_date_str)
-                return start_date.strftime('%b %d')
-            except:
-                return period_str
-        
-        daily_stats['Period_Label'] = daily_stats['Period'].apply(format_daily_label)
+        # Create better period labels (e.g., "Jun 1", "Jun 2") in one
+        # vectorized pass over the period column
+        daily_stats['Period_Label'] = daily_stats['Period'].dt.start_time.dt.strftime('%b %d')
         daily_stats['Period'] = daily_stats['Period'].astype(str)
         daily_stats['Win_Rate'] = (daily_stats['Winning_Trades'] / daily_stats['Total_Trades'] * 100).round(2)
         
         # Calculate return percentage based on total position size for each daily period
         # This is more reliable than trying to estimate client capital
         daily_stats['Return_Pct'] = (daily_stats['Total_PL'] / daily_stats['Total_Position_Size'] * 100).round(2)
-        # Replace any infinite or NaN values with 0
-        daily_stats['Return_Pct'] = daily_stats['Return_Pct'].fillna(0).replace([float('inf'), float('-inf')], 0)
+        # Replace any infinite or NaN values with 0 in one C pass
+        daily_stats['Return_Pct'] = np.nan_to_num(
+            daily_stats['Return_Pct'].to_numpy(), nan=0.0, posinf=0.0, neginf=0.0
+        )
         
         # Calculate cumulative return
         daily_stats['Cumulative_Return'] = (1 + daily_stats['Return_Pct'] / 100).cumprod()
@@ -473,7 +737,7 @@ class TradingDataManager:
         weekly_stats = trades_df.groupby('week').agg({
             'profit_loss': 'sum',
             'position_size': 'sum',
-            'win_loss': lambda x: (x == 'Win').sum(),
+            'is_win': 'sum',
             'trade_id': 'count'
         }).reset_index()
         
@@ -496,14 +760,16 @@ class TradingDataManager:
         if self.trades_df.empty:
             return {}
         
-        # Filter trades by client investment start date if client_id is provided
-        trades_df = self.trades_df.copy()
+        # Filter trades by client investment start date if client_id is
+        # provided. No copy: this method only reads and mask-filters
+        trades_df = self.trades_df
         
         if client_id:
-            # Get client investment start date
-            client_info = self.clients_df[self.clients_df['client_id'] == client_id]
-            if not client_info.empty and 'investment_start_date' in client_info.columns:
-                investment_start_date = client_info['investment_start_date'].iloc[0]
+            # Get client investment start date via the per-client dict
+            # built at load time — no boolean-mask scan of clients_df
+            client_info = self._clients_by_id.get(client_id)
+            if client_info is not None and 'investment_start_date' in client_info:
+                investment_start_date = client_info['investment_start_date']
                 if not pd.isna(investment_start_date):
                     # Convert to datetime if needed
                     if hasattr(investment_start_date, 'strftime'):
@@ -534,16 +800,15 @@ class TradingDataManager:
         
         if not winning_trades_df.empty:
             avg_winner = winning_trades_df['profit_loss'].mean()
-            # Calculate average win percentage based on buy price
-            avg_winner_pct = ((winning_trades_df['sell_price'] - winning_trades_df['buy_price']) / winning_trades_df['buy_price'] * 100).mean()
+            # return_pct is precomputed at load/upload time
+            avg_winner_pct = winning_trades_df['return_pct'].mean()
         else:
             avg_winner = 0
             avg_winner_pct = 0
             
         if not losing_trades_df.empty:
             avg_loser = losing_trades_df['profit_loss'].mean()
-            # Calculate average loss percentage based on buy price
-            avg_loser_pct = ((losing_trades_df['sell_price'] - losing_trades_df['buy_price']) / losing_trades_df['buy_price'] * 100).mean()
+            avg_loser_pct = losing_trades_df['return_pct'].mean()
         else:
             avg_loser = 0
             avg_loser_pct = 0
@@ -580,59 +845,88 @@ class TradingDataManager:
     def add_capital_movement(self, client_id, movement_type, amount, date, notes=""):
         """Add capital contribution or withdrawal"""
         movement_id = f"MOV_{len(self.capital_movements_df) + 1:04d}"
-        
-        new_movement = pd.DataFrame({
-            'movement_id': [movement_id],
-            'client_id': [client_id],
-            'date': [pd.to_datetime(date)],
-            'type': [movement_type],
-            'amount': [amount],
-            'notes': [notes]
-        })
-        
-        self.capital_movements_df = pd.concat([self.capital_movements_df, new_movement], ignore_index=True)
+
+        # Single-row in-place append; no throwaway one-row frame and no
+        # full two-frame concat per movement. Index labels survive
+        # deletions (delete_client leaves holes), so len() may collide
+        # with a live label; take max+1 for a guaranteed-fresh one
+        next_label = self.capital_movements_df.index.max() + 1 \
+            if len(self.capital_movements_df) else 0
+        self.capital_movements_df.loc[next_label] = {
+            'movement_id': movement_id,
+            'client_id': client_id,
+            'date': pd.to_datetime(date),
+            'type': movement_type,
+            'amount': amount,
+            'notes': notes
+        }
         self._save_capital_movements()
         return True
     
     def _load_monthly_capital(self):
         """Load monthly capital allocations"""
         if self.monthly_capital_file.exists():
-            self.monthly_capital_df = pd.read_csv(self.monthly_capital_file)
-            self.monthly_capital_df['month'] = pd.to_datetime(self.monthly_capital_df['month'])
+            self.monthly_capital_df = pd.read_parquet(self.monthly_capital_file)
+            # A file written before the sample frame carried real dtypes
+            # can come back with a non-datetime month column, which would
+            # break every .dt access below; normalize once on load
+            if not pd.api.types.is_datetime64_any_dtype(self.monthly_capital_df['month']):
+                self.monthly_capital_df['month'] = pd.to_datetime(
+                    self.monthly_capital_df['month'], errors='coerce'
+                )
+        elif self.monthly_capital_csv_file.exists():
+            self.monthly_capital_df = pd.read_csv(self.monthly_capital_csv_file)
+            # Month markers were serialized from a datetime column (ISO)
+            self.monthly_capital_df['month'] = pd.to_datetime(
+                self.monthly_capital_df['month'], format='%Y-%m-%d', cache=True
+            )
+            # One-shot CSV -> Parquet migration
+            self._save_monthly_capital()
         else:
-            # Create sample monthly capital structure
+            # Create sample monthly capital structure. Explicit dtypes so
+            # the empty frame round-trips through Parquet with a datetime
+            # month instead of float64
             self.monthly_capital_df = pd.DataFrame({
-                'month': [],
-                'total_capital': [],
-                'notes': []
+                'month': pd.Series([], dtype='datetime64[ns]'),
+                'total_capital': pd.Series([], dtype='float64'),
+                'notes': pd.Series([], dtype='object')
             })
             self._save_monthly_capital()
-    
+        self._index_monthly_capital()
+
+    def _index_monthly_capital(self):
+        """Rebuild the 'YYYY-MM' -> total_capital lookup used by the UI"""
+        if self.monthly_capital_df.empty:
+            self._monthly_capital_by_month = {}
+        else:
+            self._monthly_capital_by_month = dict(zip(
+                self.monthly_capital_df['month'].dt.strftime('%Y-%m'),
+                self.monthly_capital_df['total_capital']
+            ))
+
+    def get_monthly_capital_setting(self, month_year):
+        """Get the explicitly configured capital for a month, 0.0 if unset"""
+        return self._monthly_capital_by_month.get(month_year, 0.0)
+
     def _save_monthly_capital(self):
         """Save monthly capital allocations"""
-        self.monthly_capital_df.to_csv(self.monthly_capital_file, index=False)
-    
-    def set_monthly_capital(self, month, total_capital, notes=""):
-        """Set total capital for a specific month"""
-        month_dt = pd.to_datetime(month)
-        
-        # Remove existing entry for this month
-        self.monthly_capital_df = self.monthly_capital_df[self.monthly_capital_df['month'].dt.to_period('M') != month_dt.to_period('M')]
-        
-        # Add new entry
-        new_entry = pd.DataFrame({
-            'month': [month_dt],
-            'total_capital': [total_capital],
-            'notes': [notes]
-        })
-        
-        self.monthly_capital_df = pd.concat([self.monthly_capital_df, new_entry], ignore_index=True)
-        self.monthly_capital_df = self.monthly_capital_df.sort_values('month')
-        self._save_monthly_capital()
-        return True
+        self._data_version += 1
+        self._index_monthly_capital()
+        self._monthly_capital_cache.clear()
+        self._biweekly_capital_cache.clear()
+        if self._batch_depth:
+            self._dirty_files.add('monthly_capital')
+            return
+        self._write_monthly_capital()
+
+    def _write_monthly_capital(self):
+        self.monthly_capital_df.to_parquet(self.monthly_capital_file, index=False)
     
     def get_monthly_capital(self, month):
         """Get total capital for a specific month, defaults to sum of all client capital if not set"""
+        cached = self._monthly_capital_cache.get(month)
+        if cached is not None:
+            return cached
         month_dt = pd.to_datetime(month)
         month_period = month_dt.to_period('M')
         
@@ -640,24 +934,29 @@ class TradingDataManager:
         month_capital = self.monthly_capital_df[self.monthly_capital_df['month'].dt.to_period('M') == month_period]
         
         if not month_capital.empty:
-            return month_capital['total_capital'].iloc[0]
+            value = month_capital['total_capital'].iloc[0]
+            self._monthly_capital_cache[month] = value
+            return value
         else:
             # Default to sum of all client starting capital + contributions - withdrawals
             total_client_capital = self.clients_df['starting_capital'].sum()
             
-            # Add contributions and subtract withdrawals up to this month
-            if not self.capital_movements_df.empty:
-                movements_up_to_month = self.capital_movements_df[
-                    self.capital_movements_df['date'].dt.to_period('M') <= month_period
-                ]
-                contributions = movements_up_to_month[movements_up_to_month['type'] == 'contribution']['amount'].sum()
-                withdrawals = movements_up_to_month[movements_up_to_month['type'] == 'withdrawal']['amount'].sum()
-                total_client_capital += contributions - withdrawals
+            # Add contributions and subtract withdrawals up to this month:
+            # binary search on the sorted ordinals, then one prefix read
+            if self._mov_month_ord.size:
+                idx = np.searchsorted(self._mov_month_ord, month_period.ordinal, side='right')
+                if idx:
+                    total_client_capital += (self._mov_contrib_prefix[idx - 1]
+                                             - self._mov_withdraw_prefix[idx - 1])
             
+            self._monthly_capital_cache[month] = total_client_capital
             return total_client_capital
     
     def get_biweekly_capital(self, period):
         """Get total capital for a specific biweekly period, defaults to sum of all client capital if not set"""
+        cached = self._biweekly_capital_cache.get(period)
+        if cached is not None:
+            return cached
         # Parse the period string (format: "2025-06-23/2025-06-29")
         try:
             # Extract the start date from the period string
@@ -672,48 +971,54 @@ class TradingDataManager:
         period_capital = self.monthly_capital_df[self.monthly_capital_df['month'].dt.to_period('2W') == period_period]
         
         if not period_capital.empty:
-            return period_capital['total_capital'].iloc[0]
+            value = period_capital['total_capital'].iloc[0]
+            self._biweekly_capital_cache[period] = value
+            return value
         else:
             # Default to sum of all client starting capital + contributions - withdrawals
             total_client_capital = self.clients_df['starting_capital'].sum()
             
-            # Add contributions and subtract withdrawals up to this period
-            if not self.capital_movements_df.empty:
-                movements_up_to_period = self.capital_movements_df[
-                    self.capital_movements_df['date'].dt.to_period('2W') <= period_period
-                ]
-                contributions = movements_up_to_period[movements_up_to_period['type'] == 'contribution']['amount'].sum()
-                withdrawals = movements_up_to_period[movements_up_to_period['type'] == 'withdrawal']['amount'].sum()
-                total_client_capital += contributions - withdrawals
+            # Add contributions and subtract withdrawals up to this period:
+            # binary search on the sorted ordinals, then one prefix read
+            if self._mov_2w_ord.size:
+                idx = np.searchsorted(self._mov_2w_ord, period_period.ordinal, side='right')
+                if idx:
+                    total_client_capital += (self._mov_contrib_prefix[idx - 1]
+                                             - self._mov_withdraw_prefix[idx - 1])
             
+            self._biweekly_capital_cache[period] = total_client_capital
             return total_client_capital
     
     def get_client_capital_flow(self, client_id):
         """Get client's capital flow including contributions, withdrawals, and returns"""
-        # Get client info
-        client_info = self.clients_df[self.clients_df['client_id'] == client_id]
-        if client_info.empty:
+        # Get client info from the per-client dict (O(1) per lookup)
+        client_info = self._clients_by_id.get(client_id)
+        if client_info is None:
             return None
         
-        starting_capital = client_info['starting_capital'].iloc[0]
+        starting_capital = client_info['starting_capital']
         
-        # Get investment start date, handling both Series and scalar values
-        if 'investment_start_date' in client_info.columns:
-            investment_start_date = client_info['investment_start_date'].iloc[0]
-            # Convert to string if it's a pandas Timestamp or other pandas type
-            if hasattr(investment_start_date, 'strftime'):
-                investment_start_date = investment_start_date.strftime('%Y-%m-%d')
-            elif pd.isna(investment_start_date):
-                investment_start_date = None
-        else:
+        # Get investment start date, normalized to a string or None
+        investment_start_date = client_info.get('investment_start_date')
+        if hasattr(investment_start_date, 'strftime'):
+            investment_start_date = investment_start_date.strftime('%Y-%m-%d')
+        elif investment_start_date is None or pd.isna(investment_start_date):
             investment_start_date = None
         
-        # Get capital movements
-        movements = self.capital_movements_df[self.capital_movements_df['client_id'] == client_id].copy()
-        
-        # Calculate capital flow
-        total_contributions = movements[movements['type'] == 'contribution']['amount'].sum()
-        total_withdrawals = movements[movements['type'] == 'withdrawal']['amount'].sum()
+        # Get capital movements from the per-client split
+        # Read-only below (period keys are built as locals), so the slice
+        # is used as-is — no defensive copy of the client's rows
+        movements = self._mov_by_client.get(client_id)
+        if movements is None:
+            movements = self.capital_movements_df.iloc[0:0]
+
+        # Calculate capital flow; the type masks are computed once and
+        # reused for the per-period aggregations below
+        is_contrib = (movements['type'] == 'contribution').to_numpy()
+        is_withdraw = (movements['type'] == 'withdrawal').to_numpy()
+        amounts = movements['amount'].to_numpy(dtype='float64')
+        total_contributions = amounts[is_contrib].sum()
+        total_withdrawals = amounts[is_withdraw].sum()
         
         # Base capital = starting + contributions - withdrawals
         base_capital = starting_capital + total_contributions - total_withdrawals
@@ -742,61 +1047,78 @@ class TradingDataManager:
         total_available_capital = starting_capital + total_contributions - total_withdrawals
         current_capital = total_available_capital
         
-        # Process capital movements by biweekly period
-        movements['date'] = pd.to_datetime(movements['date'])
-        movements['period'] = movements['date'].dt.to_period('2W')
-        
-        for _, period_data in biweekly_returns.iterrows():
-            period_str = period_data['Period']
-            period_period = pd.Period(period_str)
-            
-            # Get contributions/withdrawals for this period
-            period_movements = movements[movements['period'] == period_period]
-            period_contributions = period_movements[period_movements['type'] == 'contribution']['amount'].sum()
-            period_withdrawals = period_movements[period_movements['type'] == 'withdrawal']['amount'].sum()
-            net_contributions = period_contributions - period_withdrawals
-            
-            # Starting capital for this period
-            period_starting_capital = current_capital
-            
-            # Add contributions/withdrawals
-            current_capital += net_contributions
-            
-            # Apply trading returns to the capital after contributions
-            period_return_pct = period_data['Return_Pct']
-            period_return_amount = current_capital * (period_return_pct / 100)
-            
-            # Apply profit split calculations using client-specific config
-            client_config = self.get_config(client_id)
-            profit_after_tax = period_return_amount * (1 - client_config['tax_rate'])
-            investor_share = profit_after_tax * client_config['investor_share']
-            trader_share = profit_after_tax * client_config['trader_share']
-            
-            current_capital += investor_share
-            
-            # Create better period label
-            try:
-                start_date_str = period_str.split('/')[0]
-                start_date = pd.to_datetime(start_date_str)
-                period_label = start_date.strftime('%b %d')
-            except:
-                period_label = period_str
-            
-            biweekly_breakdown.append({
-                'period': period_str,
-                'period_label': period_label,
-                'starting_capital': round(period_starting_capital, 2),
-                'contributions': round(period_contributions, 2),
-                'withdrawals': round(period_withdrawals, 2),
-                'net_contributions': round(net_contributions, 2),
-                'capital_after_contributions': round(period_starting_capital + net_contributions, 2),
-                'period_return_pct': period_return_pct,
-                'profit_after_tax': round(profit_after_tax, 2),
-                'investor_share': round(investor_share, 2),
-                'trader_share': round(trader_share, 2),
-                'ending_capital': round(current_capital, 2)
-            })
-        
+        # Aggregate movements once per period and fetch the client config
+        # once, instead of re-filtering/re-merging inside the loop. The
+        # date column is already datetime from _load_capital_movements, so
+        # there is nothing to re-parse, and the period keys live in locals
+        # rather than columns assigned onto the shared slice.
+        client_config = self.get_config(client_id)
+        mov_amounts = movements['amount']
+        if len(movements):
+            mov_period = movements['date'].dt.to_period('2W').to_numpy()
+            contrib_by_period = mov_amounts[is_contrib].groupby(mov_period[is_contrib]).sum().to_dict()
+            withdraw_by_period = mov_amounts[is_withdraw].groupby(mov_period[is_withdraw]).sum().to_dict()
+        else:
+            contrib_by_period = {}
+            withdraw_by_period = {}
+
+        # The whole progression is a 1-D recurrence,
+        # c_{k+1} = (c_k + net_contrib_k) * growth_k, solved in closed form
+        # with cumprod/cumsum instead of a Python loop per period
+        periods = biweekly_returns['Period'].values
+        period_labels = biweekly_returns['Period_Label'].values
+        returns_pct = biweekly_returns['Return_Pct'].to_numpy(dtype='float64')
+        # One C-level parse of all period strings, instead of a pd.Period
+        # construction per element
+        period_keys = pd.PeriodIndex(periods, freq='2W')
+        contribs = np.array([contrib_by_period.get(p, 0.0) for p in period_keys])
+        withdraws = np.array([withdraw_by_period.get(p, 0.0) for p in period_keys])
+        net_contrib = contribs - withdraws
+        starting, after_contrib, ending, profit_after_tax, investor_share, trader_share = \
+            self._capital_progression(current_capital, returns_pct, net_contrib, client_config)
+
+        # Round each column once as a vector; the per-row round(float(...))
+        # calls were the last scalar work left in this construction.
+        # tolist() yields plain Python floats for the dicts.
+        sc_r, c_r, w_r, n_r, ac_r, pa_r, iv_r, td_r, ec_r = (
+            np.round(a, 2).tolist() for a in (
+                starting, contribs, withdraws, net_contrib, after_contrib,
+                profit_after_tax, investor_share, trader_share, ending))
+        biweekly_breakdown = [
+            {
+                'period': p,
+                'period_label': lbl,
+                'starting_capital': sc,
+                'contributions': c,
+                'withdrawals': w,
+                'net_contributions': n,
+                'capital_after_contributions': ac,
+                'period_return_pct': rp,
+                'profit_after_tax': pa,
+                'investor_share': iv,
+                'trader_share': td,
+                'ending_capital': ec
+            }
+            for p, lbl, sc, c, w, n, ac, rp, pa, iv, td, ec in zip(
+                periods, period_labels, sc_r, c_r, w_r, n_r,
+                ac_r, returns_pct, pa_r, iv_r, td_r, ec_r)
+        ]
+        current_capital = float(ending[-1]) if len(ending) else current_capital
+        
+        # Precompute the cumulative chart series in one NumPy pass so the
+        # pages can plot them without per-rerun pandas arithmetic
+        if biweekly_breakdown:
+            period_profit = ending - after_contrib
+            cumulative_profit = np.cumsum(period_profit)
+            total_capital = float(starting[0]) + cumulative_profit + np.cumsum(net_contrib)
+            for p, pp, cp, tc in zip(biweekly_breakdown,
+                                     np.round(period_profit, 2).tolist(),
+                                     np.round(cumulative_profit, 2).tolist(),
+                                     np.round(total_capital, 2).tolist()):
+                p['period_profit'] = pp
+                p['cumulative_profit'] = cp
+                p['total_capital'] = tc
+
         # Calculate total returns (sum of all trading profits)
         # Sum up all the profit_after_tax from trading returns
         total_returns = sum([period['profit_after_tax'] for period in biweekly_breakdown])
@@ -807,50 +1129,49 @@ class TradingDataManager:
         monthly_current_capital = starting_capital
         
         if not monthly_returns.empty:
-            # Process capital movements by month
-            movements['month'] = movements['date'].dt.to_period('M')
-            
-            for _, month_data in monthly_returns.iterrows():
-                month_str = month_data['Month']
-                month_period = pd.Period(month_str)
-                
-                # Get contributions/withdrawals for this month
-                month_movements = movements[movements['month'] == month_period]
-                month_contributions = month_movements[month_movements['type'] == 'contribution']['amount'].sum()
-                month_withdrawals = month_movements[month_movements['type'] == 'withdrawal']['amount'].sum()
-                net_contributions = month_contributions - month_withdrawals
-                
-                # Starting capital for this month
-                month_starting_capital = monthly_current_capital
-                
-                # Add contributions/withdrawals
-                monthly_current_capital += net_contributions
-                
-                # Apply trading returns
-                month_return_pct = month_data['Return_Pct']
-                month_return_amount = monthly_current_capital * (month_return_pct / 100)
-                
-                # Apply profit split calculations using client-specific config
-                client_config = self.get_config(client_id)
-                profit_after_tax = month_return_amount * (1 - client_config['tax_rate'])
-                investor_share = profit_after_tax * client_config['investor_share']
-                trader_share = profit_after_tax * client_config['trader_share']
-                
-                monthly_current_capital += investor_share
-                
-                monthly_breakdown.append({
-                    'month': month_str,
-                    'starting_capital': round(month_starting_capital, 2),
-                    'contributions': round(month_contributions, 2),
-                    'withdrawals': round(month_withdrawals, 2),
-                    'net_contributions': round(net_contributions, 2),
-                    'capital_after_contributions': round(month_starting_capital + net_contributions, 2),
-                    'monthly_return_pct': month_return_pct,
-                    'profit_after_tax': round(profit_after_tax, 2),
-                    'investor_share': round(investor_share, 2),
-                    'trader_share': round(trader_share, 2),
-                    'ending_capital': round(monthly_current_capital, 2)
-                })
+            # Process capital movements by month, aggregated once up front
+            if len(movements):
+                mov_month = movements['date'].dt.to_period('M').to_numpy()
+                contrib_by_month = mov_amounts[is_contrib].groupby(mov_month[is_contrib]).sum().to_dict()
+                withdraw_by_month = mov_amounts[is_withdraw].groupby(mov_month[is_withdraw]).sum().to_dict()
+            else:
+                contrib_by_month = {}
+                withdraw_by_month = {}
+
+            # Same closed-form recurrence as the biweekly progression
+            months = monthly_returns['Month'].values
+            m_returns_pct = monthly_returns['Return_Pct'].to_numpy(dtype='float64')
+            month_keys = pd.PeriodIndex(months, freq='M')
+            m_contribs = np.array([contrib_by_month.get(m, 0.0) for m in month_keys])
+            m_withdraws = np.array([withdraw_by_month.get(m, 0.0) for m in month_keys])
+            m_net_contrib = m_contribs - m_withdraws
+            m_starting, m_after_contrib, m_ending, m_profit_after_tax, m_investor, m_trader = \
+                self._capital_progression(monthly_current_capital, m_returns_pct,
+                                          m_net_contrib, client_config)
+
+            m_sc, m_c, m_w, m_n, m_ac, m_pa, m_iv, m_td, m_ec = (
+                np.round(a, 2).tolist() for a in (
+                    m_starting, m_contribs, m_withdraws, m_net_contrib,
+                    m_after_contrib, m_profit_after_tax, m_investor,
+                    m_trader, m_ending))
+            monthly_breakdown = [
+                {
+                    'month': m,
+                    'starting_capital': sc,
+                    'contributions': c,
+                    'withdrawals': w,
+                    'net_contributions': n,
+                    'capital_after_contributions': ac,
+                    'monthly_return_pct': rp,
+                    'profit_after_tax': pa,
+                    'investor_share': iv,
+                    'trader_share': td,
+                    'ending_capital': ec
+                }
+                for m, sc, c, w, n, ac, rp, pa, iv, td, ec in zip(
+                    months, m_sc, m_c, m_w, m_n, m_ac, m_returns_pct,
+                    m_pa, m_iv, m_td, m_ec)
+            ]
         
         # Get the ending capital from the last period (current capital)
         # Use monthly breakdown if available, otherwise use biweekly
@@ -869,8 +1190,48 @@ class TradingDataManager:
             'total_withdrawals': total_withdrawals,
             'total_returns': total_returns,
             'monthly_breakdown': monthly_breakdown,
-            'biweekly_breakdown': biweekly_breakdown
+            'biweekly_breakdown': biweekly_breakdown,
+            # Pre-built frames so pages don't re-run DataFrame(list-of-dicts)
+            # dtype inference on every rerun
+            'monthly_breakdown_df': self._breakdown_frame(monthly_breakdown),
+            'biweekly_breakdown_df': self._breakdown_frame(biweekly_breakdown)
         }
+
+    @staticmethod
+    def _capital_progression(start_capital, returns_pct, net_contrib, client_config):
+        """Solve the per-period capital recurrence in closed form.
+
+        The loop form is c_{k+1} = (c_k + nc_k) * g_k with
+        g_k = 1 + (r_k/100) * (1 - tax_rate) * investor_share. Dividing
+        through by the running product of g turns it into a prefix sum, so
+        the whole progression falls out of one cumprod and one cumsum.
+        Returns the starting, after-contribution and ending capital per
+        period plus the profit-split components, all as float64 arrays.
+        """
+        r = np.asarray(returns_pct, dtype='float64')
+        nc = np.asarray(net_contrib, dtype='float64')
+        tax_rate = client_config['tax_rate']
+        g = 1.0 + (r / 100.0) * (1.0 - tax_rate) * client_config['investor_share']
+        growth = np.cumprod(g)
+        prior_growth = np.concatenate(([1.0], growth[:-1]))
+        deflated = start_capital + np.concatenate(([0.0], np.cumsum(nc / prior_growth)[:-1]))
+        starting = deflated * prior_growth
+        after_contrib = starting + nc
+        ending = after_contrib * g
+        profit_after_tax = after_contrib * (r / 100.0) * (1.0 - tax_rate)
+        investor_share = profit_after_tax * client_config['investor_share']
+        trader_share = profit_after_tax * client_config['trader_share']
+        return starting, after_contrib, ending, profit_after_tax, investor_share, trader_share
+
+    @staticmethod
+    def _breakdown_frame(breakdown):
+        """Convert a breakdown list of dicts to a DataFrame via bulk column
+        arrays, skipping pandas' per-row dtype inference"""
+        if not breakdown:
+            return pd.DataFrame()
+        columns = list(breakdown[0].keys())
+        data = {col: np.array([row[col] for row in breakdown]) for col in columns}
+        return pd.DataFrame(data, copy=False)
     
     def update_config(self, tax_rate=None, trader_share=None, client_id=None):
         """Update configuration settings for a specific client or global settings"""
@@ -900,10 +1261,17 @@ class TradingDataManager:
         return True
     
     def get_config(self, client_id=None):
-        """Get configuration for a specific client or global configuration"""
+        """Get configuration for a specific client or global configuration
+
+        The merged dict is memoized per client until the config is next
+        saved or reloaded, so repeated calls within a rerun are free.
+        """
+        cached = self._config_cache.get(client_id)
+        if cached is not None:
+            return cached
         if client_id is None:
             # Return global configuration with defaults
-            return {
+            merged = {
                 "tax_rate": self.config.get('global', {}).get('tax_rate', 0.25),
                 "trader_share": self.config.get('global', {}).get('trader_share', 0.40),
                 "investor_share": self.config.get('global', {}).get('investor_share', 0.60),
@@ -914,13 +1282,15 @@ class TradingDataManager:
             # Return client-specific configuration with fallback to global
             client_config = self.config.get('clients', {}).get(client_id, {})
             global_config = self.config.get('global', {})
-            
-            return {
+
+            merged = {
                 "tax_rate": client_config.get('tax_rate', global_config.get('tax_rate', 0.25)),
                 "trader_share": client_config.get('trader_share', global_config.get('trader_share', 0.40)),
                 "investor_share": client_config.get('investor_share', global_config.get('investor_share', 0.60)),
                 "auto_remove_day_trades": global_config.get('auto_remove_day_trades', True)
             }
+        self._config_cache[client_id] = merged
+        return merged
     
     def get_all_client_configs(self):
         """Get all client configurations"""
@@ -928,9 +1298,11 @@ class TradingDataManager:
     
     def get_available_clients(self):
         """Get list of available clients for configuration"""
-        if self.clients_df.empty:
-            return []
-        return self.clients_df['client_id'].tolist()
+        return self.client_ids
+
+    def get_client_info(self, client_id):
+        """Get a single client's record as a dict, or None if unknown"""
+        return self._clients_by_id.get(client_id)
 
     def add_or_update_client(self, username, name, email, starting_capital, investment_start_date=None, active=True):
         """Add or update a client record in clients.csv
@@ -952,12 +1324,25 @@ class TradingDataManager:
             'active': active
         }
 
+        # Upsert in place: overwrite the existing row if the client is
+        # already present, otherwise append one row — no filter + one-row
+        # concat rebuilding the whole frame per call
         if not self.clients_df.empty and 'client_id' in self.clients_df.columns:
-            # Remove any existing row for this client_id
-            self.clients_df = self.clients_df[self.clients_df['client_id'] != client_id]
+            mask = (self.clients_df['client_id'] == client_id).to_numpy()
+        else:
+            mask = None
 
-        # Append the new/updated client
-        self.clients_df = pd.concat([self.clients_df, pd.DataFrame([new_row])], ignore_index=True)
+        if mask is not None and mask.any():
+            matching = self.clients_df.index[mask]
+            cols = list(new_row)
+            self.clients_df.loc[matching[0], cols] = [new_row[c] for c in cols]
+            if len(matching) > 1:
+                self.clients_df = self.clients_df.drop(matching[1:])
+        else:
+            # Index labels survive deletions, so len() may collide with a
+            # live label; take max+1 for a guaranteed-fresh one
+            next_label = self.clients_df.index.max() + 1 if len(self.clients_df) else 0
+            self.clients_df.loc[next_label] = new_row
         self._save_clients()
         return True
 
@@ -970,33 +1355,49 @@ class TradingDataManager:
         if not users_json.exists():
             return False
         try:
-            import json
-            with open(users_json, 'r') as f:
-                users = json.load(f)
-            rows = []
+            # Re-parse only when the file actually changed on disk
+            users_mtime = users_json.stat().st_mtime
+            if users_mtime == self._users_mtime:
+                users = self._users_cache
+            else:
+                with open(users_json, 'r') as f:
+                    users = json.load(f)
+                self._users_mtime = users_mtime
+                self._users_cache = users
+            usernames, names, emails, capitals, start_dates, actives = [], [], [], [], [], []
             for username, info in users.items():
                 if info.get('role') == 'client':
                     investment_start_date = info.get('investment_start_date')
                     if investment_start_date:
                         try:
-                            investment_start_date = pd.to_datetime(investment_start_date).date()
+                            # users.json stores isoformat() dates
+                            investment_start_date = pd.to_datetime(
+                                investment_start_date, format='%Y-%m-%d'
+                            ).date()
                         except:
                             investment_start_date = pd.Timestamp.now().date()
                     else:
                         investment_start_date = pd.Timestamp.now().date()
                     
-                    rows.append({
-                        'client_id': username,
-                        'username': username,
-                        'name': info.get('name', ''),
-                        'email': info.get('email', ''),
-                        'starting_capital': info.get('starting_capital', 0),
-                        'investment_start_date': investment_start_date,
-                        'active': info.get('active', True)
-                    })
-            if rows:
-                # Remove any duplicates by client_id then append all
-                df_new = pd.DataFrame(rows)
+                    usernames.append(username)
+                    names.append(info.get('name', ''))
+                    emails.append(info.get('email', ''))
+                    capitals.append(info.get('starting_capital', 0))
+                    start_dates.append(investment_start_date)
+                    actives.append(info.get('active', True))
+            if usernames:
+                # Column-wise construction: pandas builds each column from a
+                # homogeneous list instead of re-inferring dtypes from a
+                # list of per-row dicts
+                df_new = pd.DataFrame({
+                    'client_id': usernames,
+                    'username': usernames,
+                    'name': names,
+                    'email': emails,
+                    'starting_capital': pd.Series(capitals, dtype='float64'),
+                    'investment_start_date': start_dates,
+                    'active': actives
+                })
                 if not self.clients_df.empty:
                     self.clients_df = self.clients_df[~self.clients_df['client_id'].isin(df_new['client_id'])]
                 self.clients_df = pd.concat([self.clients_df, df_new], ignore_index=True)
@@ -1008,31 +1409,33 @@ class TradingDataManager:
     def delete_client(self, client_id):
         """Delete a client and all associated data"""
         try:
-            # Remove from clients dataframe
-            if not self.clients_df.empty and 'client_id' in self.clients_df.columns:
-                self.clients_df = self.clients_df[self.clients_df['client_id'] != client_id]
-                self._save_clients()
-            
-            # Remove from trades dataframe
-            if not self.trades_df.empty and 'client_id' in self.trades_df.columns:
-                self.trades_df = self.trades_df[self.trades_df['client_id'] != client_id]
-                self._save_trades()
-            
-            # Remove from capital movements dataframe
-            if not self.capital_movements_df.empty and 'client_id' in self.capital_movements_df.columns:
-                self.capital_movements_df = self.capital_movements_df[self.capital_movements_df['client_id'] != client_id]
-                self._save_capital_movements()
-            
-            # Remove from monthly capital dataframe
-            if not self.monthly_capital_df.empty and 'client_id' in self.monthly_capital_df.columns:
-                self.monthly_capital_df = self.monthly_capital_df[self.monthly_capital_df['client_id'] != client_id]
-                self._save_monthly_capital()
-            
-            # Remove client-specific configuration
-            if 'clients' in self.config and client_id in self.config['clients']:
-                del self.config['clients'][client_id]
-                self._save_config()
-            
+            # Batch the five per-frame saves into one flush at the end
+            with self.batch_saves():
+                # Remove from clients dataframe
+                if not self.clients_df.empty and 'client_id' in self.clients_df.columns:
+                    self.clients_df = self.clients_df[self.clients_df['client_id'] != client_id]
+                    self._save_clients()
+
+                # Remove from trades dataframe
+                if not self.trades_df.empty and 'client_id' in self.trades_df.columns:
+                    self.trades_df = self.trades_df[self.trades_df['client_id'] != client_id]
+                    self._save_trades()
+
+                # Remove from capital movements dataframe
+                if not self.capital_movements_df.empty and 'client_id' in self.capital_movements_df.columns:
+                    self.capital_movements_df = self.capital_movements_df[self.capital_movements_df['client_id'] != client_id]
+                    self._save_capital_movements()
+
+                # Remove from monthly capital dataframe
+                if not self.monthly_capital_df.empty and 'client_id' in self.monthly_capital_df.columns:
+                    self.monthly_capital_df = self.monthly_capital_df[self.monthly_capital_df['client_id'] != client_id]
+                    self._save_monthly_capital()
+
+                # Remove client-specific configuration
+                if 'clients' in self.config and client_id in self.config['clients']:
+                    del self.config['clients'][client_id]
+                    self._save_config()
+
             return True
         except Exception as e:
             print(f"Error deleting client {client_id}: {str(e)}")
@@ -1040,6 +1443,16 @@ class TradingDataManager:
     
     def get_sp500_monthly_returns(self):
         """Get S&P 500 monthly returns for comparison"""
+        # Day-keyed disk cache: the yfinance fetch costs a network round
+        # trip plus five years of daily bars, and daily granularity is
+        # plenty for a monthly benchmark
+        cache_path = self.data_dir / f"sp500_{datetime.now():%Y%m%d}.parquet"
+        if cache_path.exists():
+            try:
+                return pd.read_parquet(cache_path)
+            except Exception:
+                pass
+
         try:
             import yfinance as yf
             
@@ -1050,13 +1463,14 @@ class TradingDataManager:
             if hist.empty:
                 return pd.DataFrame()
             
-            # Calculate monthly returns
-            monthly_data = hist.resample('ME').last()
-            monthly_returns = monthly_data['Close'].pct_change() * 100
+            # Calculate monthly returns; grouping the close by month period
+            # skips resampling the unused OHLC columns
+            monthly_close = hist['Close'].groupby(hist.index.to_period('M')).last()
+            monthly_returns = monthly_close.pct_change() * 100
             
             # Create DataFrame with month and return
             sp500_returns = pd.DataFrame({
-                'Month': monthly_returns.index.strftime('%Y-%m'),
+                'Month': monthly_returns.index.astype(str),
                 'SP500_Return_Pct': monthly_returns.values
             }).dropna()
             
@@ -1064,6 +1478,11 @@ class TradingDataManager:
             sp500_returns['SP500_Cumulative_Return'] = (1 + sp500_returns['SP500_Return_Pct'] / 100).cumprod() - 1
             sp500_returns['SP500_Cumulative_Return'] = sp500_returns['SP500_Cumulative_Return'] * 100
             
+            # Replace any stale day-keyed caches with today's
+            for stale in self.data_dir.glob("sp500_*.parquet"):
+                stale.unlink(missing_ok=True)
+            sp500_returns.to_parquet(cache_path, index=False)
+            
             return sp500_returns
             
         except ImportError:
@@ -1073,14 +1492,42 @@ class TradingDataManager:
             print(f"Error fetching S&P 500 data: {str(e)}")
             return pd.DataFrame()
     
-    def refresh_data(self):
-        """Reload all data from files to ensure latest data is available"""
+    def _file_changed(self, path):
+        """Record a file's mtime and report whether it changed since last seen"""
         try:
-            self._load_config()
-            self._load_trades()
-            self._load_clients()
-            self._load_capital_movements()
-            self._load_monthly_capital()
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            mtime = None
+        if self._mtimes.get(path) == mtime:
+            return False
+        self._mtimes[path] = mtime
+        return True
+
+    def refresh_data(self, min_interval=0):
+        """Reload all data from files to ensure latest data is available
+
+        With min_interval > 0 the reload is skipped when another session
+        already refreshed within that window, so N concurrent sessions
+        trigger one disk read per interval instead of N.
+        """
+        try:
+            with self._refresh_lock:
+                now = time.time()
+                if min_interval and now - self._last_refresh < min_interval:
+                    return True
+                # A stat per file is microseconds; only re-parse what
+                # actually changed on disk
+                if self._file_changed(self.config_file):
+                    self._load_config()
+                if self._file_changed(self.trades_file):
+                    self._load_trades()
+                if self._file_changed(self.clients_file):
+                    self._load_clients()
+                if self._file_changed(self.capital_movements_file):
+                    self._load_capital_movements()
+                if self._file_changed(self.monthly_capital_file):
+                    self._load_monthly_capital()
+                self._last_refresh = now
             return True
         except Exception as e:
             print(f"Error refreshing data: {str(e)}")
@@ -1098,27 +1545,25 @@ class TradingDataManager:
     def set_monthly_capital(self, month_year, capital_amount):
         """Set the total capital for a specific month"""
         try:
-            # Convert month_year string to datetime
-            month_dt = pd.to_datetime(month_year + '-01')
-            
-            # Check if this month already exists
-            existing_month = self.monthly_capital_df[
-                self.monthly_capital_df['month'].dt.to_period('M') == month_dt.to_period('M')
-            ]
-            
-            if not existing_month.empty:
+            # month_year is already 'YYYY-MM'; build the timestamp directly
+            # and compare at month resolution without Period objects
+            month_dt = pd.Timestamp(int(month_year[:4]), int(month_year[5:7]), 1)
+            month_mask = self.monthly_capital_df['month'].values.astype('datetime64[M]') == np.datetime64(month_year, 'M')
+
+            if month_mask.any():
                 # Update existing month
-                self.monthly_capital_df.loc[
-                    self.monthly_capital_df['month'].dt.to_period('M') == month_dt.to_period('M'),
-                    'total_capital'
-                ] = capital_amount
+                self.monthly_capital_df.loc[month_mask, 'total_capital'] = capital_amount
             else:
-                # Add new month
-                new_row = pd.DataFrame({
-                    'month': [month_dt],
-                    'total_capital': [capital_amount]
-                })
-                self.monthly_capital_df = pd.concat([self.monthly_capital_df, new_row], ignore_index=True)
+                # Add new month via single-row enlargement. Labels survive
+                # delete_monthly_capital, so len() can collide with a live
+                # row; max+1 is always fresh
+                next_label = self.monthly_capital_df.index.max() + 1 \
+                    if len(self.monthly_capital_df) else 0
+                self.monthly_capital_df.loc[next_label] = {
+                    'month': month_dt,
+                    'total_capital': capital_amount,
+                    'notes': np.nan
+                }
             
             # Save to file
             self._save_monthly_capital()
@@ -1131,13 +1576,10 @@ class TradingDataManager:
     def delete_monthly_capital(self, month_year):
         """Delete the monthly capital entry for a specific month"""
         try:
-            # Convert month_year string to datetime
-            month_dt = pd.to_datetime(month_year + '-01')
-            
-            # Remove the month from the dataframe
-            self.monthly_capital_df = self.monthly_capital_df[
-                self.monthly_capital_df['month'].dt.to_period('M') != month_dt.to_period('M')
-            ]
+            # Remove the month via a month-resolution mask; no string
+            # parsing or Period construction needed
+            month_mask = self.monthly_capital_df['month'].values.astype('datetime64[M]') == np.datetime64(month_year, 'M')
+            self.monthly_capital_df = self.monthly_capital_df[~month_mask]
             
             # Save to file
             self._save_monthly_capital()
@@ -1153,23 +1595,21 @@ class TradingDataManager:
             if self.trades_df.empty:
                 return False, "No trades found"
             
-            # Calculate return percentage for all trades
-            self.trades_df['return_pct'] = ((self.trades_df['sell_price'] - self.trades_df['buy_price']) / self.trades_df['buy_price'] * 100)
-            
-            # Find trades matching the criteria
+            # Filter to the one stock first, then compute returns over just
+            # those rows — no full-frame arithmetic or column write-back
             stock_trades = self.trades_df[self.trades_df['stock'] == stock_symbol]
-            matching_trades = stock_trades[
-                (stock_trades['return_pct'] >= target_return_pct - tolerance) & 
-                (stock_trades['return_pct'] <= target_return_pct + tolerance)
-            ]
-            
-            if matching_trades.empty:
+            return_pct = (
+                (stock_trades['sell_price'].to_numpy() - stock_trades['buy_price'].to_numpy())
+                / stock_trades['buy_price'].to_numpy() * 100.0
+            )
+            matching = np.abs(return_pct - target_return_pct) <= tolerance
+
+            if not matching.any():
                 return False, f"No {stock_symbol} trades found with return percentage around {target_return_pct}%"
-            
+
             # Remove the matching trades
-            original_count = len(self.trades_df)
-            self.trades_df = self.trades_df[~self.trades_df.index.isin(matching_trades.index)]
-            removed_count = original_count - len(self.trades_df)
+            removed_count = int(matching.sum())
+            self.trades_df = self.trades_df.drop(stock_trades.index[matching])
             
             # Save the updated data
             self._save_trades()
@@ -1179,17 +1619,45 @@ class TradingDataManager:
         except Exception as e:
             return False, f"Error removing trades: {str(e)}"
     
+    def remove_trades_batch(self, specs):
+        """Remove trades matching several (stock, target_return_pct, tolerance)
+        specs with one combined mask and one save"""
+        try:
+            if self.trades_df.empty:
+                return False, "No trades found"
+
+            return_pct = (
+                (self.trades_df['sell_price'].to_numpy() - self.trades_df['buy_price'].to_numpy())
+                / self.trades_df['buy_price'].to_numpy() * 100.0
+            )
+            stocks = self.trades_df['stock'].to_numpy()
+            mask = np.zeros(len(self.trades_df), dtype=bool)
+            for stock_symbol, target_return_pct, tolerance in specs:
+                mask |= (stocks == stock_symbol) & (np.abs(return_pct - target_return_pct) <= tolerance)
+
+            removed_count = int(mask.sum())
+            if removed_count == 0:
+                return False, "No matching trades found to remove"
+
+            self.trades_df = self.trades_df.loc[~mask]
+            self._queue_save()
+
+            return True, f"Removed {removed_count} trades matching {len(specs)} filters"
+
+        except Exception as e:
+            return False, f"Error removing trades: {str(e)}"
+
     def update_client(self, client_id, name, email, starting_capital, investment_start_date, active, new_password=None):
         """Update client information"""
         try:
-            # Update clients dataframe
+            # Update clients dataframe with one indexer dispatch instead
+            # of five single-column assignments
             client_mask = self.clients_df['client_id'] == client_id
             if client_mask.any():
-                self.clients_df.loc[client_mask, 'name'] = name
-                self.clients_df.loc[client_mask, 'email'] = email
-                self.clients_df.loc[client_mask, 'starting_capital'] = starting_capital
-                self.clients_df.loc[client_mask, 'investment_start_date'] = investment_start_date
-                self.clients_df.loc[client_mask, 'active'] = active
+                self.clients_df.loc[
+                    client_mask,
+                    ['name', 'email', 'starting_capital', 'investment_start_date', 'active']
+                ] = [name, email, starting_capital, investment_start_date, active]
                 
                 # Save clients data
                 self._save_clients()
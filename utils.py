@@ -4,17 +4,45 @@ import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 import streamlit as st
+import os
 from datetime import datetime, timedelta
 import yaml
+try:
+    # libyaml C bindings; ~10x faster than the pure-Python parser
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
 from pathlib import Path
 
+def optimize_dtypes(df):
+    """Shrink default-inferred dtypes in place: downcast numeric columns
+    to the narrowest width that holds their values and categorize the
+    symbol column. Narrower columns cut the memory every downstream
+    vectorized pass and chart serialization has to move."""
+    for c in df.select_dtypes('float').columns:
+        df[c] = pd.to_numeric(df[c], downcast='float')
+    for c in df.select_dtypes('integer').columns:
+        df[c] = pd.to_numeric(df[c], downcast='integer')
+    if 'symbol' in df.columns:
+        df['symbol'] = df['symbol'].astype('category')
+    return df
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _load_file_cached(file_path, mtime):
+    """Parse a data file once per (path, mtime); reruns reuse the frame"""
+    if file_path.endswith('.csv'):
+        # Arrow's multi-threaded CSV reader (pyarrow is a requirement,
+        # doubling as the Parquet engine)
+        return optimize_dtypes(pd.read_csv(file_path, engine='pyarrow'))
+    return optimize_dtypes(pd.read_excel(file_path))
+
 def load_data(file_path):
     """Load data from various file formats"""
     try:
-        if file_path.endswith('.csv'):
-            return pd.read_csv(file_path)
-        elif file_path.endswith('.xlsx') or file_path.endswith('.xls'):
-            return pd.read_excel(file_path)
+        if file_path.endswith(('.csv', '.xlsx', '.xls')):
+            # The mtime in the key makes an overwritten file re-parse
+            # while plain widget reruns hit the cache
+            return _load_file_cached(file_path, Path(file_path).stat().st_mtime)
         else:
             st.error("Unsupported file format. Please use CSV or Excel files.")
             return None
@@ -34,45 +62,115 @@ def validate_trading_data(df):
     # Check for data types
     if 'date' in df.columns:
         try:
-            df['date'] = pd.to_datetime(df['date'])
+            # cache=True parses each distinct date string once; blotters
+            # repeat the same trading days across many rows
+            df['date'] = pd.to_datetime(df['date'], cache=True)
         except:
             st.warning("Date column could not be converted to datetime")
             return False
-    
+
     if 'quantity' in df.columns and 'price' in df.columns:
-        if not (df['quantity'].dtype in ['int64', 'float64'] and 
-                df['price'].dtype in ['int64', 'float64']):
+        # Accept any numeric dtype (int32, float32, nullable ints, ...)
+        # rather than the exact-name check that forced users to recast
+        if not (pd.api.types.is_numeric_dtype(df['quantity']) and
+                pd.api.types.is_numeric_dtype(df['price'])):
             st.warning("Quantity and price columns should be numeric")
             return False
     
     return True
 
-def calculate_pnl(df):
-    """Calculate profit and loss from trading data"""
+def calculate_pnl(df, symbol=None):
+    """Calculate profit and loss from trading data.
+
+    When symbol is given, only that symbol's rows are computed — filter
+    first, compute second, so a single-symbol chart doesn't pay for the
+    cumulative sums of every other symbol in the blotter.
+    """
     if 'quantity' not in df.columns or 'price' not in df.columns:
         return df
-    
-    df['position_value'] = df['quantity'] * df['price']
-    df['cumulative_position'] = df['quantity'].cumsum()
-    df['cumulative_value'] = df['position_value'].cumsum()
-    
-    # Calculate P&L (simplified - assumes FIFO)
-    df['pnl'] = 0.0
-    for i in range(1, len(df)):
-        if df.iloc[i]['quantity'] < 0:  # Selling
-            # Calculate average cost from previous positions
-            prev_positions = df.iloc[:i]
-            if len(prev_positions) > 0:
-                avg_cost = prev_positions['position_value'].sum() / prev_positions['quantity'].sum()
-                df.iloc[i, df.columns.get_loc('pnl')] = (df.iloc[i]['price'] - avg_cost) * abs(df.iloc[i]['quantity'])
-    
-    return df
+
+    if symbol is not None and 'symbol' in df.columns:
+        df = df[df['symbol'] == symbol]
+
+    # The cumulative math below assumes chronological order
+    if 'date' in df.columns:
+        df = df.sort_values('date', kind='stable')
+
+    # Work on plain float64 arrays end to end: no Series dispatch, no
+    # index alignment, and each intermediate is one contiguous buffer
+    qty = df['quantity'].to_numpy(np.float64, copy=False)
+    price = df['price'].to_numpy(np.float64, copy=False)
+    position_value = qty * price
+    if symbol is None and 'symbol' in df.columns:
+        # Running positions per symbol, so one symbol's sells never draw
+        # cost basis from another's buys when charting "All Symbols".
+        # A pre-filtered single-symbol frame takes the plain cumsum path.
+        grp = df.groupby('symbol', sort=False)
+        cumulative_position = grp['quantity'].cumsum().to_numpy(np.float64)
+        cumulative_value = pd.Series(position_value, index=df.index) \
+            .groupby(df['symbol'], sort=False).cumsum().to_numpy()
+    else:
+        cumulative_position = np.cumsum(qty)
+        cumulative_value = np.cumsum(position_value)
+
+    # Calculate P&L (simplified average-cost basis, not lot-by-lot FIFO)
+    # The average cost before each row is the running value/quantity ratio
+    # of all prior rows; subtracting the current row from the running sums
+    # gives the prefix totals for every row (and zero at each symbol's
+    # first row) without re-summing the prefix per row
+    prev_value = cumulative_value - position_value
+    prev_qty = cumulative_position - qty
+    avg_cost = np.divide(prev_value, prev_qty,
+                         out=np.zeros_like(prev_value), where=prev_qty != 0)
+    pnl = np.where(
+        qty < 0,  # Selling
+        (price - avg_cost) * np.abs(qty),
+        0.0
+    )
+    if len(pnl):
+        # No prior position on the first row, matching the old loop
+        pnl[0] = 0.0
+
+    # One batched column insert — a single block reshape instead of four
+    # piecemeal ones — and the caller's frame stays unmodified
+    return df.assign(
+        position_value=position_value,
+        cumulative_position=cumulative_position,
+        cumulative_value=cumulative_value,
+        pnl=pnl
+    )
+
+def _m4_downsample(x, y, target=1000):
+    """Cap a line series at ~4 points per pixel-sized bucket (first, min,
+    max, last), which preserves the drawn shape while keeping the payload
+    sent to the browser bounded. Small series pass through untouched."""
+    n = len(y)
+    if n <= target * 4:
+        return x, y
+    y_arr = np.asarray(y, dtype=float)
+    bins = np.linspace(0, n, target + 1).astype(int)
+    keep = set()
+    for lo, hi in zip(bins[:-1], bins[1:]):
+        if lo >= hi:
+            continue
+        seg = y_arr[lo:hi]
+        keep.update((lo, lo + int(np.argmin(seg)), lo + int(np.argmax(seg)), hi - 1))
+    idx = np.fromiter(sorted(keep), dtype=int)
+    return np.asarray(x)[idx], y_arr[idx]
 
 def create_trading_chart(df, symbol=None):
     """Create interactive trading chart"""
     if df.empty:
         return None
-    
+    return _build_chart(df, symbol)
+
+@st.cache_data(show_spinner=False, hash_funcs={
+    # Row-hash the frame instead of pickling it: cheap, and reruns with
+    # the same data reuse the built figure
+    pd.DataFrame: lambda d: (d.shape, int(pd.util.hash_pandas_object(d, index=False).sum()))
+})
+def _build_chart(df, symbol):
+    """Figure construction for create_trading_chart, memoized per frame"""
     fig = make_subplots(
         rows=2, cols=1,
         shared_xaxes=True,
@@ -81,12 +179,17 @@ def create_trading_chart(df, symbol=None):
         row_width=[0.7, 0.3]
     )
     
+    # ndarrays serialize through Plotly's binary fast path; Series would
+    # be boxed element-by-element into Python floats first
+    x_vals = df['date'].to_numpy() if 'date' in df.columns else df.index.to_numpy()
+
     # Price chart
     if 'price' in df.columns:
+        price_x, price_y = _m4_downsample(x_vals, df['price'].to_numpy())
         fig.add_trace(
-            go.Scatter(
-                x=df['date'] if 'date' in df.columns else df.index,
-                y=df['price'],
+            go.Scattergl(
+                x=price_x,
+                y=price_y,
                 mode='lines+markers',
                 name='Price',
                 line=dict(color='blue')
@@ -96,23 +199,27 @@ def create_trading_chart(df, symbol=None):
     
     # Volume chart
     if 'quantity' in df.columns:
-        colors = ['red' if q < 0 else 'green' for q in df['quantity']]
+        # Extract the quantity array once and derive both the bar heights
+        # and the sell/buy colors from it
+        qty = df['quantity'].to_numpy()
         fig.add_trace(
             go.Bar(
-                x=df['date'] if 'date' in df.columns else df.index,
-                y=df['quantity'].abs(),
+                x=x_vals,
+                y=np.abs(qty),
                 name='Volume',
-                marker_color=colors
+                marker_color=np.where(qty < 0, 'red', 'green')
             ),
             row=1, col=1
         )
     
     # P&L chart
     if 'pnl' in df.columns:
+        cum_pnl = df['pnl'].to_numpy().cumsum()
+        pnl_x, pnl_y = _m4_downsample(x_vals, cum_pnl)
         fig.add_trace(
-            go.Scatter(
-                x=df['date'] if 'date' in df.columns else df.index,
-                y=df['pnl'].cumsum(),
+            go.Scattergl(
+                x=pnl_x,
+                y=pnl_y,
                 mode='lines',
                 name='Cumulative P&L',
                 line=dict(color='orange')
@@ -143,12 +250,33 @@ def format_percentage(value):
     except:
         return str(value)
 
+def format_currency_series(s):
+    """Format a whole Series as currency in one pass.
+
+    Formats each distinct value once and maps the results back, so a
+    column with K unique values costs K f-string calls instead of N.
+    Missing values render as empty strings.
+    """
+    mapping = {v: format_currency(v) for v in s.dropna().unique()}
+    return s.map(mapping).fillna('')
+
+def format_percentage_series(s):
+    """Format a whole Series as percentages; see format_currency_series"""
+    mapping = {v: format_percentage(v) for v in s.dropna().unique()}
+    return s.map(mapping).fillna('')
+
+@st.cache_data(show_spinner=False)
+def _read_yaml_cached(path, mtime):
+    """Parse the YAML config once per mtime; save_config bumps the mtime
+    so the next load re-reads without any explicit invalidation"""
+    with open(path, 'r') as file:
+        return yaml.load(file, Loader=_YamlLoader)
+
 def load_config():
     """Load application configuration"""
     config_path = Path(__file__).parent / "config" / "app.yaml"
     try:
-        with open(config_path, 'r') as file:
-            return yaml.safe_load(file)
+        return _read_yaml_cached(str(config_path), config_path.stat().st_mtime)
     except FileNotFoundError:
         return {}
 
@@ -156,8 +284,13 @@ def save_config(config):
     """Save application configuration"""
     config_path = Path(__file__).parent / "config" / "app.yaml"
     try:
-        with open(config_path, 'w') as file:
-            yaml.dump(config, file, default_flow_style=False)
+        # Write-then-rename: a crash mid-dump leaves the old config intact
+        # instead of a truncated file
+        tmp_path = config_path.with_suffix('.yaml.tmp')
+        with open(tmp_path, 'wb') as file:
+            yaml.dump(config, file, Dumper=_YamlDumper,
+                      default_flow_style=False, encoding='utf-8')
+        os.replace(tmp_path, config_path)
         return True
     except Exception as e:
         st.error(f"Error saving configuration: {str(e)}")